@@ -108,6 +108,9 @@ class MainWindow(QMainWindow):
         self._create_menu()
         self._create_ui()
         
+        # Warm the product table's image-cell icon in the background
+        self.icon_manager.prewarm(("image",))
+        
         # Load companies
         self._load_companies()
         
@@ -6,6 +6,7 @@ Auto-saves on close.
 
 import os
 from datetime import datetime
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QTextEdit, QPushButton, QTabWidget, QScrollArea,
@@ -26,6 +27,9 @@ from .components.notification.toast_notification import ToastNotification
 from .styles.theme_manager import ThemeManager
 from ..logic.config.config_manager import ConfigManager
 
+# Resolved once at import instead of on every window instantiation
+_CONFIG_DIR = Path(__file__).resolve().parents[1] / "logic" / "config"
+
 
 class ObservationsWindow(QDialog):
     """
@@ -68,8 +72,8 @@ class ObservationsWindow(QDialog):
         
     def _load_title_styles(self):
         try:
-            path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "logic", "config", "title_styles.json")
-            if os.path.exists(path):
+            path = _CONFIG_DIR / "title_styles.json"
+            if path.exists():
                 with open(path, 'r', encoding='utf-8') as f:
                     return json.load(f).get("styles", [])
         except: pass
@@ -3,15 +3,20 @@ Products Window - Dedicated window for managing quotation products and shipping.
 Features product table editing, shipping options, and live preview.
 """
 
-import os
 import json
+import math
+from functools import lru_cache
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QFrame, QSplitter, QScrollArea,
-    QCheckBox, QDoubleSpinBox, QComboBox, QSpinBox, QSizePolicy
+    QCheckBox, QDoubleSpinBox, QComboBox, QSpinBox, QSizePolicy, QTableWidgetItem,
+    QApplication
+)
+from PyQt6.QtGui import QFont, QPainter, QPen, QColor, QPixmap, QStaticText, QTransform
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QTimer, QRect, QSize, QStringListModel, QModelIndex, QThread
 )
-from PyQt6.QtGui import QFont, QPainter, QPen, QColor, QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect
 
 from .components.buttons.animated_button import AnimatedButton, PrimaryButton, DangerButton
 from .components.tables.animated_table import QuotationTable
@@ -21,6 +26,238 @@ from .styles.icon_manager import IconManager
 from ..logic.config.config_manager import ConfigManager
 
 
+# Shipping types offered in the combo, with an index for O(1) lookup on load
+_SHIPPING_TYPES = (
+    "Gratis",
+    "Envío Local",
+    "Delivery",
+    "Encomienda",
+    "Express/Urgente",
+    "Pickup (Retiro)",
+    "Courier Nacional",
+    "Courier Internacional",
+    "Flete",
+    "Transporte Especializado"
+)
+_SHIPPING_TYPE_INDEX = {name: i for i, name in enumerate(_SHIPPING_TYPES)}
+
+# Resolved once at import instead of on every units load
+_UNITS_PATH = Path(__file__).resolve().parents[2] / "media" / "data" / "units" / "units.json"
+
+# Units shown until units.json has been loaded
+_DEFAULT_UNITS = ("u", "c/u", "pqt", "kg", "g", "L", "m", "m²")
+
+
+@lru_cache(maxsize=1)
+def _get_units_list() -> tuple:
+    """
+    Load unit abbreviations from units.json.
+    Cached for the whole process so re-opening the window skips disk I/O and parsing.
+    """
+    units_list = list(_DEFAULT_UNITS)  # Default fallback
+    try:
+        if _UNITS_PATH.is_file():
+            with _UNITS_PATH.open('r', encoding='utf-8') as f:
+                units_data = json.load(f)
+            
+            # Extract all unit abbreviations
+            units_list = []
+            for category, units in units_data.items():
+                if category != "Envio":  # Skip shipping units
+                    for unit_name, unit_info in units.items():
+                        abbrev = unit_info.get('abreviacion', '')
+                        if abbrev and abbrev not in units_list:
+                            units_list.append(abbrev)
+            
+            # Sort alphabetically for easier finding
+            units_list.sort()
+    except Exception as e:
+        print(f"Error loading units: {e}")
+    
+    # Tuple so the cached value can be shared safely between windows
+    return tuple(units_list)
+
+
+class _UnitsLoader(QThread):
+    """Worker thread that loads units.json so window construction never waits on disk."""
+    units_loaded = pyqtSignal(list)
+    
+    def run(self):
+        self.units_loaded.emit(list(_get_units_list()))
+
+
+# Window stylesheet, parsed once when set on the central widget. Rules are
+# ordered container-first so a widget's own rules win over the cascaded ones.
+_PRODUCTS_WINDOW_QSS = """
+    QSplitter#ProductsSplitter::handle {
+        background-color: rgba(255, 255, 255, 0.1);
+        width: 2px;
+    }
+    
+    /* Header */
+    QFrame#ProductsHeader, #ProductsHeader QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(10, 132, 255, 0.3), stop:1 rgba(94, 92, 230, 0.3));
+        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    QLabel#ProductsHeaderIcon {
+        background: rgba(10, 132, 255, 0.4);
+        border: 2px solid #0A84FF;
+        border-radius: 12px;
+    }
+    QLabel#ProductsTitle {
+        font-size: 20px;
+        font-weight: bold;
+        color: white;
+    }
+    QLabel#ProductsDescription {
+        font-size: 13px;
+        color: rgba(255, 255, 255, 0.7);
+    }
+    QLabel#ProductsCountBadge {
+        background: rgba(52, 199, 89, 0.3);
+        border: 1px solid #34C759;
+        border-radius: 12px;
+        padding: 6px 16px;
+        font-weight: bold;
+        color: #34C759;
+    }
+    
+    /* Left panel: toolbar, shipping and totals */
+    #ProductsLeftPanel, #ProductsLeftPanel * {
+        background: transparent;
+    }
+    QLabel#ProductsToolbarTitle {
+        font-size: 15px;
+        font-weight: bold;
+        color: white;
+    }
+    QFrame#ShippingFrame, #ShippingFrame QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(10, 132, 255, 0.15), stop:1 rgba(10, 132, 255, 0.05));
+        border: 1px solid rgba(10, 132, 255, 0.3);
+        border-radius: 12px;
+    }
+    QCheckBox#EnableShipping {
+        font-weight: bold;
+        font-size: 14px;
+        color: white;
+    }
+    QCheckBox#EnableShipping::indicator {
+        width: 22px;
+        height: 22px;
+        border-radius: 6px;
+        border: 2px solid #0A84FF;
+    }
+    QCheckBox#EnableShipping::indicator:checked {
+        background: #0A84FF;
+    }
+    QDoubleSpinBox#ShippingInput {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: white;
+        font-size: 14px;
+    }
+    QComboBox#ShippingTypeCombo {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: white;
+        min-width: 180px;
+    }
+    QComboBox#ShippingTypeCombo::drop-down {
+        border: none;
+        padding-right: 10px;
+    }
+    QComboBox#ShippingTypeCombo QAbstractItemView {
+        background: #2D2D30;
+        color: white;
+        selection-background-color: #0A84FF;
+    }
+    QLabel#ShippingDisplay {
+        font-size: 18px;
+        font-weight: bold;
+        color: #0A84FF;
+    }
+    QFrame#TotalsFrame, #TotalsFrame QFrame {
+        background: rgba(52, 199, 89, 0.1);
+        border: 1px solid rgba(52, 199, 89, 0.3);
+        border-radius: 12px;
+    }
+    QLabel#SubtotalLabel {
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QLabel#TotalLabel {
+        font-weight: bold;
+        font-size: 18px;
+        color: #34C759;
+    }
+    
+    /* Right panel: live preview */
+    #ProductsRightPanel, #ProductsRightPanel * {
+        background: transparent;
+    }
+    QLabel#PreviewPlaceholder {
+        color: rgba(255, 255, 255, 0.5);
+        font-size: 13px;
+    }
+    QLabel#PreviewTitle {
+        font-size: 15px;
+        font-weight: bold;
+        color: white;
+    }
+    QScrollArea#PreviewScroll {
+        background: rgba(0, 0, 0, 0.3);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 12px;
+    }
+    QLabel#PreviewLabel {
+        background: white;
+        padding: 20px;
+    }
+    
+    /* Footer */
+    QFrame#ProductsFooter, #ProductsFooter QFrame {
+        background: rgba(0, 0, 0, 0.3);
+        border-top: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    QLabel#SummaryLabel {
+        color: rgba(255, 255, 255, 0.6);
+        font-size: 13px;
+    }
+"""
+
+
+# Item data role holding the parsed float amount of the "Importe" cell
+_AMOUNT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+# Shared stylesheet for the per-row unit combos, set once on the table
+_UNIT_COMBO_QSS = """
+    QComboBox {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: white;
+        min-height: 30px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    QComboBox QAbstractItemView {
+        background: #2D2D30;
+        color: white;
+        selection-background-color: #0A84FF;
+    }
+"""
+
+
 class ProductsWindow(QMainWindow):
     """
     Dedicated window for managing quotation products.
@@ -33,90 +270,163 @@ class ProductsWindow(QMainWindow):
     
     products_saved = pyqtSignal(dict)
     
+    # Preview layout constants
+    _PREVIEW_COL_WIDTHS = (160, 50, 50, 70, 70)
+    _PREVIEW_HEADERS = ("Descripción", "Cant.", "Unid.", "P.Unit.", "Importe")
+    
+    # Preview fonts and colors, shared by all windows (see _init_preview_resources)
+    _static_initialized = False
+    
     def __init__(self, products_data: dict = None, parent=None):
         super().__init__(parent)
         
         self.config = ConfigManager()
+        # Settings are read once per window; each read goes through configparser
+        self._moneda = self.config.moneda
+        self._tema = self.config.tema
+        self._fuente = self.config.fuente
+        self._font_size = max(8, self.config.tamaño_fuente)
         self.icon_manager = IconManager.get_instance()
         self._products_data = products_data or {}
         self._is_modified = False
         
-        # Setup preview timer BEFORE anything else that might trigger it
+        # Parsed amount per table row, kept aligned with the table rows
+        self._row_amounts = []
+        self._subtotal = 0.0
+        
+        # Set while the handler writes the computed amount back to the table
+        self._updating_amount = False
+        # Set during bulk loads so the subtotal is summed once at the end
+        self._deferring_subtotal = False
+        
+        # Reusable preview render buffers, one per reduced render scale
+        self._preview_pixmaps = {}
+        
+        # Preview widgets are built on first show (see _build_preview_panel)
+        self._preview_built = False
+        
+        # Content and scale of the last rendered preview, to skip no-op renders
+        self._last_preview_key = None
+        self._last_preview_scale = 0.0
+        
+        # Setup preview timers BEFORE anything else that might trigger them:
+        # a quick low-resolution pass while typing and a full repaint on idle
         self._preview_timer = QTimer()
         self._preview_timer.setSingleShot(True)
-        self._preview_timer.timeout.connect(self._update_preview)
-        
-        # Load units from JSON
-        self._units_list = self._load_units()
+        self._preview_timer.timeout.connect(self._deferred_update)
+        self._full_preview_timer = QTimer()
+        self._full_preview_timer.setSingleShot(True)
+        self._full_preview_timer.timeout.connect(self._update_preview)
+        
+        # Leading-edge throttle for the shipping spin box
+        self._shipping_throttle = QTimer()
+        self._shipping_throttle.setSingleShot(True)
+        self._shipping_throttle.setInterval(100)
+        self._shipping_throttle.timeout.connect(self._on_shipping_throttle_timeout)
+        self._shipping_pending = False
+        
+        # Load units from JSON (cached across windows). On a cold cache the
+        # defaults are shown and the full list is swapped in when loaded.
+        if _get_units_list.cache_info().currsize:
+            self._units_list = list(_get_units_list())
+        else:
+            self._units_list = list(_DEFAULT_UNITS)
+            # Parented to the application so it outlives a quickly closed window
+            loader = _UnitsLoader(QApplication.instance())
+            loader.units_loaded.connect(self._on_units_loaded)
+            loader.finished.connect(loader.deleteLater)
+            loader.start()
         
         # Setup window
         self._setup_window()
         self._create_ui()
         self._load_data()
     
-    def _load_units(self) -> list:
-        """Load units from units.json file."""
-        units_list = ["u", "c/u", "pqt", "kg", "g", "L", "m", "m²"]  # Default fallback
-        try:
-            # Find the units.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            units_path = os.path.join(base_dir, "media", "data", "units", "units.json")
-            
-            if os.path.exists(units_path):
-                with open(units_path, 'r', encoding='utf-8') as f:
-                    units_data = json.load(f)
-                
-                # Extract all unit abbreviations
-                units_list = []
-                for category, units in units_data.items():
-                    if category != "Envio":  # Skip shipping units
-                        for unit_name, unit_info in units.items():
-                            abbrev = unit_info.get('abreviacion', '')
-                            if abbrev and abbrev not in units_list:
-                                units_list.append(abbrev)
-                
-                # Sort alphabetically for easier finding
-                units_list.sort()
-        except Exception as e:
-            print(f"Error loading units: {e}")
-        
-        return units_list
+    @classmethod
+    def _init_preview_resources(cls):
+        """Create the fonts and colors used by the preview once a QApplication exists."""
+        if cls._static_initialized:
+            return
+        cls._FONT_TITLE = QFont("Arial", 14, QFont.Weight.Bold)
+        cls._FONT_BOLD = QFont("Arial", 10, QFont.Weight.Bold)
+        cls._FONT_BODY = QFont("Arial", 10)
+        cls._FONT_TOTAL = QFont("Arial", 12, QFont.Weight.Bold)
+        cls._COL_BACKGROUND = QColor("#FFFFFF")
+        cls._COL_TEXT = QColor("#1D1D1F")
+        cls._COL_HEADER_BG = QColor("#F0F0F0")
+        cls._COL_MUTED = QColor("#888888")
+        cls._COL_ACCENT = QColor("#0A84FF")
+        cls._COL_TOTAL_BG = QColor("#34C759").lighter(170)
+        cls._PEN_SEPARATOR = QPen(QColor("#E0E0E0"), 1)
+        
+        # Fixed labels are laid out once and redrawn without re-shaping
+        def static_text(text, font):
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(QTransform(), font)
+            return static
+        
+        cls._STATIC_TITLE = static_text("Listado de Productos", cls._FONT_TITLE)
+        cls._STATIC_HEADERS = tuple(static_text(h, cls._FONT_BOLD) for h in cls._PREVIEW_HEADERS)
+        cls._STATIC_NO_PRODUCTS = static_text("Sin productos", cls._FONT_BODY)
+        cls._STATIC_TOTAL = static_text("TOTAL", cls._FONT_TOTAL)
+        cls._static_initialized = True
+    
+    @pyqtSlot(list)
+    def _on_units_loaded(self, units: list):
+        """Swap the full units list into the shared model, keeping each row's unit."""
+        if units == self._units_list:
+            return
+        self._units_list = units
+        
+        # Resetting the model clears the combos' text, so restore it silently
+        combos = [self.table.cellWidget(row, 2) for row in range(self.table.rowCount())]
+        texts = [combo.currentText() if combo else None for combo in combos]
+        for combo in combos:
+            if combo:
+                combo.blockSignals(True)
+        self._unit_model.setStringList(units)
+        for combo, text in zip(combos, texts):
+            if combo:
+                combo.setCurrentText(text)
+                combo.blockSignals(False)
     
     def _setup_window(self):
         """Configure window properties."""
+        self._init_preview_resources()
+        
         self.setWindowTitle("Gestión de Productos - Cotización")
         self.setMinimumSize(1200, 700)
         self.resize(1400, 800)
         
         # Apply theme
-        ThemeManager.apply_theme(self, self.config.tema)
-        font_size = max(8, self.config.tamaño_fuente)
-        self.setFont(QFont(self.config.fuente, font_size))
+        ThemeManager.apply_theme(self, self._tema)
+        self.setFont(QFont(self._fuente, self._font_size))
         
         # Update icon manager color
-        icon_color = "#1D1D1F" if "Claro" in self.config.tema else "#FFFFFF"
+        icon_color = "#1D1D1F" if "Claro" in self._tema else "#FFFFFF"
         self.icon_manager.set_theme_color(icon_color)
     
     def _create_ui(self):
         """Create the main user interface."""
         central = QWidget()
         self.setCentralWidget(central)
+        # Every widget below is styled by objectName from this one stylesheet
+        central.setStyleSheet(_PRODUCTS_WINDOW_QSS)
         
         main_layout = QVBoxLayout(central)
         main_layout.setSpacing(0)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
+        # Single units model shared by every row's unit combobox
+        self._unit_model = QStringListModel(self._units_list, self)
+        
         # Header
         self._create_header(main_layout)
         
         # Content with splitter
         splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: rgba(255, 255, 255, 0.1);
-                width: 2px;
-            }
-        """)
+        splitter.setObjectName("ProductsSplitter")
         
         # Left panel - Products table and shipping
         left_panel = self._create_left_panel()
@@ -140,24 +450,14 @@ class ProductsWindow(QMainWindow):
     def _create_header(self, parent_layout):
         """Create header section."""
         header = QFrame()
-        header.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(10, 132, 255, 0.3), stop:1 rgba(94, 92, 230, 0.3));
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        header.setObjectName("ProductsHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(24, 16, 24, 16)
         
         # Icon
         icon_label = QLabel()
         icon_label.setFixedSize(48, 48)
-        icon_label.setStyleSheet("""
-            background: rgba(10, 132, 255, 0.4);
-            border: 2px solid #0A84FF;
-            border-radius: 12px;
-        """)
+        icon_label.setObjectName("ProductsHeaderIcon")
         icon_label.setPixmap(self.icon_manager.get_pixmap("box", 28))
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(icon_label)
@@ -167,11 +467,11 @@ class ProductsWindow(QMainWindow):
         text_layout.setSpacing(4)
         
         title = QLabel("Gestión de Productos")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: white;")
+        title.setObjectName("ProductsTitle")
         text_layout.addWidget(title)
         
         desc = QLabel("Agrega, edita y organiza los productos de tu cotización. Incluye envío si aplica.")
-        desc.setStyleSheet("font-size: 13px; color: rgba(255, 255, 255, 0.7);")
+        desc.setObjectName("ProductsDescription")
         text_layout.addWidget(desc)
         
         header_layout.addLayout(text_layout)
@@ -179,14 +479,7 @@ class ProductsWindow(QMainWindow):
         
         # Products count badge
         self.products_count_label = QLabel("0 productos")
-        self.products_count_label.setStyleSheet("""
-            background: rgba(52, 199, 89, 0.3);
-            border: 1px solid #34C759;
-            border-radius: 12px;
-            padding: 6px 16px;
-            font-weight: bold;
-            color: #34C759;
-        """)
+        self.products_count_label.setObjectName("ProductsCountBadge")
         header_layout.addWidget(self.products_count_label)
         
         parent_layout.addWidget(header)
@@ -194,7 +487,7 @@ class ProductsWindow(QMainWindow):
     def _create_left_panel(self) -> QWidget:
         """Create left panel with products table and shipping."""
         panel = QWidget()
-        panel.setStyleSheet("background: transparent;")
+        panel.setObjectName("ProductsLeftPanel")
         layout = QVBoxLayout(panel)
         layout.setSpacing(12)
         layout.setContentsMargins(16, 16, 8, 16)
@@ -204,7 +497,7 @@ class ProductsWindow(QMainWindow):
         toolbar.setSpacing(8)
         
         toolbar_title = QLabel("Lista de Productos")
-        toolbar_title.setStyleSheet("font-size: 15px; font-weight: bold; color: white;")
+        toolbar_title.setObjectName("ProductsToolbarTitle")
         toolbar.addWidget(toolbar_title)
         toolbar.addStretch()
         
@@ -232,20 +525,17 @@ class ProductsWindow(QMainWindow):
         
         # Products table
         self.table = QuotationTable()
+        # Unit combos inherit this instead of parsing a stylesheet per row
+        self.table.setStyleSheet(self.table.styleSheet() + _UNIT_COMBO_QSS)
         self.table.itemChanged.connect(self._on_table_changed)
+        self.table.model().rowsInserted.connect(self._on_rows_inserted)
+        self.table.model().rowsRemoved.connect(self._on_rows_removed)
         self.table.resolution_warning.connect(self._show_warning)
         layout.addWidget(self.table, 1)
         
         # Shipping section
         shipping_frame = QFrame()
-        shipping_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(10, 132, 255, 0.15), stop:1 rgba(10, 132, 255, 0.05));
-                border: 1px solid rgba(10, 132, 255, 0.3);
-                border-radius: 12px;
-            }
-        """)
+        shipping_frame.setObjectName("ShippingFrame")
         shipping_layout = QHBoxLayout(shipping_frame)
         shipping_layout.setContentsMargins(16, 12, 16, 12)
         shipping_layout.setSpacing(16)
@@ -257,22 +547,7 @@ class ProductsWindow(QMainWindow):
         
         # Enable checkbox
         self.enable_shipping_check = QCheckBox("Incluir Envío")
-        self.enable_shipping_check.setStyleSheet("""
-            QCheckBox {
-                font-weight: bold;
-                font-size: 14px;
-                color: white;
-            }
-            QCheckBox::indicator {
-                width: 22px;
-                height: 22px;
-                border-radius: 6px;
-                border: 2px solid #0A84FF;
-            }
-            QCheckBox::indicator:checked {
-                background: #0A84FF;
-            }
-        """)
+        self.enable_shipping_check.setObjectName("EnableShipping")
         self.enable_shipping_check.stateChanged.connect(self._on_shipping_toggled)
         shipping_layout.addWidget(self.enable_shipping_check)
         
@@ -281,58 +556,20 @@ class ProductsWindow(QMainWindow):
         self.shipping_input.setRange(0, 99999)
         self.shipping_input.setDecimals(2)
         self.shipping_input.setValue(0)
-        self.shipping_input.setPrefix(f"{self.config.moneda} ")
+        self.shipping_input.setPrefix(f"{self._moneda} ")
         self.shipping_input.setMinimumHeight(40)
         self.shipping_input.setMinimumWidth(150)
         self.shipping_input.setEnabled(False)
-        self.shipping_input.valueChanged.connect(self._trigger_preview)
-        self.shipping_input.setStyleSheet("""
-            QDoubleSpinBox {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: white;
-                font-size: 14px;
-            }
-        """)
+        self.shipping_input.valueChanged.connect(self._throttled_shipping_changed)
+        self.shipping_input.setObjectName("ShippingInput")
         shipping_layout.addWidget(self.shipping_input)
         
         # Shipping type
         self.shipping_type_combo = QComboBox()
-        self.shipping_type_combo.addItems([
-            "Gratis",
-            "Envío Local",
-            "Delivery",
-            "Encomienda",
-            "Express/Urgente",
-            "Pickup (Retiro)",
-            "Courier Nacional",
-            "Courier Internacional",
-            "Flete",
-            "Transporte Especializado"
-        ])
+        self.shipping_type_combo.addItems(_SHIPPING_TYPES)
         self.shipping_type_combo.setMinimumHeight(40)
         self.shipping_type_combo.setEnabled(False)
-        self.shipping_type_combo.setStyleSheet("""
-            QComboBox {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: white;
-                min-width: 180px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background: #2D2D30;
-                color: white;
-                selection-background-color: #0A84FF;
-            }
-        """)
+        self.shipping_type_combo.setObjectName("ShippingTypeCombo")
         self.shipping_type_combo.currentTextChanged.connect(self._trigger_preview)
         shipping_layout.addWidget(self.shipping_type_combo)
         
@@ -340,37 +577,27 @@ class ProductsWindow(QMainWindow):
         
         # Shipping total display
         self.shipping_display = QLabel("+ 0.00")
-        self.shipping_display.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #0A84FF;
-        """)
+        self.shipping_display.setObjectName("ShippingDisplay")
         shipping_layout.addWidget(self.shipping_display)
         
         layout.addWidget(shipping_frame)
         
         # Totals section
         totals_frame = QFrame()
-        totals_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(52, 199, 89, 0.1);
-                border: 1px solid rgba(52, 199, 89, 0.3);
-                border-radius: 12px;
-            }
-        """)
+        totals_frame.setObjectName("TotalsFrame")
         totals_layout = QHBoxLayout(totals_frame)
         totals_layout.setContentsMargins(16, 12, 16, 12)
         
         totals_layout.addWidget(QLabel("Subtotal:"))
-        self.subtotal_label = QLabel(f"0.00 {self.config.moneda}")
-        self.subtotal_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.subtotal_label = QLabel(f"0.00 {self._moneda}")
+        self.subtotal_label.setObjectName("SubtotalLabel")
         totals_layout.addWidget(self.subtotal_label)
         
         totals_layout.addStretch()
         
         totals_layout.addWidget(QLabel("Total:"))
-        self.total_label = QLabel(f"0.00 {self.config.moneda}")
-        self.total_label.setStyleSheet("font-weight: bold; font-size: 18px; color: #34C759;")
+        self.total_label = QLabel(f"0.00 {self._moneda}")
+        self.total_label.setObjectName("TotalLabel")
         totals_layout.addWidget(self.total_label)
         
         layout.addWidget(totals_frame)
@@ -378,17 +605,34 @@ class ProductsWindow(QMainWindow):
         return panel
     
     def _create_right_panel(self) -> QWidget:
-        """Create right panel with live preview."""
+        """Create right panel; the live preview itself is built on first show."""
         panel = QWidget()
-        panel.setStyleSheet("background: transparent;")
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(12)
-        layout.setContentsMargins(8, 16, 16, 16)
+        panel.setObjectName("ProductsRightPanel")
+        self._right_panel_layout = QVBoxLayout(panel)
+        self._right_panel_layout.setSpacing(12)
+        self._right_panel_layout.setContentsMargins(8, 16, 16, 16)
+        
+        self._preview_placeholder = QLabel("La vista previa aparecerá aquí")
+        self._preview_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._preview_placeholder.setObjectName("PreviewPlaceholder")
+        self._right_panel_layout.addWidget(self._preview_placeholder, 1)
+        
+        return panel
+    
+    def _build_preview_panel(self):
+        """Build the live preview widgets and render the first preview."""
+        if self._preview_built:
+            return
+        
+        layout = self._right_panel_layout
+        layout.removeWidget(self._preview_placeholder)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
         
         # Preview header
         preview_header = QHBoxLayout()
         preview_title = QLabel("Vista Previa")
-        preview_title.setStyleSheet("font-size: 15px; font-weight: bold; color: white;")
+        preview_title.setObjectName("PreviewTitle")
         preview_header.addWidget(preview_title)
         preview_header.addStretch()
         
@@ -402,39 +646,29 @@ class ProductsWindow(QMainWindow):
         # Preview scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-            }
-        """)
+        scroll.setObjectName("PreviewScroll")
         
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-        self.preview_label.setStyleSheet("background: white; padding: 20px;")
+        self.preview_label.setObjectName("PreviewLabel")
         self.preview_label.setMinimumWidth(350)
         scroll.setWidget(self.preview_label)
         
         layout.addWidget(scroll, 1)
         
-        return panel
+        self._preview_built = True
+        self._update_preview()
     
     def _create_footer(self, parent_layout):
         """Create footer with action buttons."""
         footer = QFrame()
-        footer.setStyleSheet("""
-            QFrame {
-                background: rgba(0, 0, 0, 0.3);
-                border-top: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        footer.setObjectName("ProductsFooter")
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(24, 12, 24, 12)
         
         # Summary
         self.summary_label = QLabel("Sin productos agregados")
-        self.summary_label.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 13px;")
+        self.summary_label.setObjectName("SummaryLabel")
         footer_layout.addWidget(self.summary_label)
         
         footer_layout.addStretch()
@@ -462,24 +696,35 @@ class ProductsWindow(QMainWindow):
             self._update_preview()
             return
         
-        # Load products
+        # Load products in one batch: no per-row itemChanged handling or repaints,
+        # counts and preview are refreshed once below
         products = self._products_data.get('products', [])
-        for prod in products:
-            row = self._add_product_with_unit(
-                description=prod.get('descripcion', ''),
-                quantity=str(prod.get('cantidad', '')),
-                unit=prod.get('unidad', ''),
-                price=str(prod.get('precio_unitario', '')),
-                amount=str(prod.get('importe', '')),
-                image_path=prod.get('imagen', '')
-            )
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        self._deferring_subtotal = True
+        try:
+            for prod in products:
+                self._add_product_with_unit(
+                    description=prod.get('descripcion', ''),
+                    quantity=str(prod.get('cantidad', '')),
+                    unit=prod.get('unidad', ''),
+                    price=str(prod.get('precio_unitario', '')),
+                    amount=str(prod.get('importe', '')),
+                    image_path=prod.get('imagen', '')
+                )
+        finally:
+            self._deferring_subtotal = False
+            self._subtotal = self._sum_row_amounts()
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
         
         # Load shipping
         shipping = self._products_data.get('shipping', {})
         if shipping.get('enabled', False):
             self.enable_shipping_check.setChecked(True)
             self.shipping_input.setValue(shipping.get('amount', 0))
-            idx = self.shipping_type_combo.findText(shipping.get('type', 'Envío Local'))
+            idx = _SHIPPING_TYPE_INDEX.get(shipping.get('type', 'Envío Local'), -1)
             if idx >= 0:
                 self.shipping_type_combo.setCurrentIndex(idx)
         
@@ -496,36 +741,66 @@ class ProductsWindow(QMainWindow):
             amount=amount,
             image_path=image_path
         )
+        self._refresh_row_amount(row)
         
         # Create unit combobox for this row
         unit_combo = QComboBox()
         unit_combo.setEditable(True)  # Allow custom units
-        unit_combo.addItems(self._units_list)
+        # Custom units must not be inserted into the shared model
+        unit_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        unit_combo.setModel(self._unit_model)
         unit_combo.setCurrentText(unit if unit else 'u')
-        unit_combo.setStyleSheet("""
-            QComboBox {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: white;
-                min-height: 30px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background: #2D2D30;
-                color: white;
-                selection-background-color: #0A84FF;
-            }
-        """)
-        unit_combo.currentTextChanged.connect(lambda: self._on_unit_changed())
+        unit_combo.currentTextChanged.connect(self._on_unit_changed)
         self.table.setCellWidget(row, 2, unit_combo)  # Column 2 is Unit
         
         return row
     
+    def _refresh_row_amount(self, row: int, amount: float = None):
+        """
+        Update the cached amount of a single row and the running subtotal.
+        
+        Args:
+            row: Table row to refresh
+            amount: Already computed amount; parsed from the cell text when omitted
+        """
+        if row >= len(self._row_amounts):
+            return
+        amount_item = self.table.item(row, 4)
+        if amount_item is None:
+            amount = 0.0
+        else:
+            if amount is None:
+                try:
+                    amount = float(amount_item.text() or 0)
+                except ValueError:
+                    amount = 0.0
+            # Keep the parsed value on the item so collecting data skips re-parsing
+            self._updating_amount = True
+            try:
+                amount_item.setData(_AMOUNT_ROLE, amount)
+            finally:
+                self._updating_amount = False
+        if amount != self._row_amounts[row]:
+            self._row_amounts[row] = amount
+            if not self._deferring_subtotal:
+                self._subtotal = self._sum_row_amounts()
+    
+    def _sum_row_amounts(self) -> float:
+        """Accurately sum the cached row amounts, ignoring NaN entries."""
+        return math.fsum(a for a in self._row_amounts if a == a)
+    
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_inserted(self, parent, first: int, last: int):
+        """Keep the amount cache aligned when rows are inserted."""
+        self._row_amounts[first:first] = [0.0] * (last - first + 1)
+    
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_removed(self, parent, first: int, last: int):
+        """Keep the amount cache aligned when rows are removed."""
+        del self._row_amounts[first:last + 1]
+        self._subtotal = self._sum_row_amounts()
+    
+    @pyqtSlot()
     def _on_unit_changed(self):
         """Handle unit combobox change."""
         self._mark_modified()
@@ -562,13 +837,8 @@ class ProductsWindow(QMainWindow):
             
             products.append(prod)
         
-        # Calculate subtotal
-        subtotal = 0
-        for prod in products:
-            try:
-                subtotal += float(prod.get('importe', 0) or 0)
-            except ValueError:
-                pass
+        # Calculate subtotal from the per-row amount cache
+        subtotal = self._sum_row_amounts()
         
         # Get shipping
         shipping = {
@@ -589,40 +859,44 @@ class ProductsWindow(QMainWindow):
             'total': total
         }
     
+    @pyqtSlot()
     def _add_product(self):
         """Add a new product row."""
         self._add_product_with_unit()
         self._mark_modified()
-        self._update_counts()
         self._trigger_preview()
     
+    @pyqtSlot()
     def _duplicate_product(self):
         """Duplicate selected product."""
         row = self.table.currentRow()
         if row >= 0:
             self.table.duplicateRow(row)
             self._mark_modified()
-            self._update_counts()
             self._trigger_preview()
     
+    @pyqtSlot()
     def _remove_product(self):
         """Remove selected product."""
         row = self.table.currentRow()
         if row >= 0:
             self.table.removeRow(row)
             self._mark_modified()
-            self._update_counts()
             self._trigger_preview()
     
+    @pyqtSlot()
     def _clear_table(self):
         """Clear all products."""
         self.table.setRowCount(0)
         self._mark_modified()
-        self._update_counts()
         self._trigger_preview()
     
+    @pyqtSlot(QTableWidgetItem)
     def _on_table_changed(self, item):
         """Handle table cell changes."""
+        if self._updating_amount:
+            return
+        
         row = item.row()
         col = item.column()
         
@@ -638,15 +912,22 @@ class ProductsWindow(QMainWindow):
                 amount = qty * price
                 amount_item = self.table.item(row, 4)
                 if amount_item:
-                    self.table.blockSignals(True)
-                    amount_item.setText(f"{amount:.2f}")
-                    self.table.blockSignals(False)
+                    self._updating_amount = True
+                    try:
+                        amount_item.setText(f"{amount:.2f}")
+                    finally:
+                        self._updating_amount = False
+                    # Same value the two-decimal text would parse back to
+                    self._refresh_row_amount(row, round(amount, 2))
             except ValueError:
-                pass
+                self._refresh_row_amount(row)
+        elif col == 4:
+            self._refresh_row_amount(row)
         
         self._mark_modified()
         self._trigger_preview()
     
+    @pyqtSlot(int)
     def _on_shipping_toggled(self, state):
         """Enable/disable shipping inputs."""
         enabled = state == Qt.CheckState.Checked.value
@@ -655,42 +936,94 @@ class ProductsWindow(QMainWindow):
         self._mark_modified()
         self._trigger_preview()
     
+    @pyqtSlot(float)
+    def _throttled_shipping_changed(self, value: float):
+        """
+        Throttle shipping amount changes: the first change applies immediately,
+        further ones within the interval are folded into one trailing update.
+        """
+        if self._shipping_throttle.isActive():
+            self._shipping_pending = True
+            return
+        self._trigger_preview()
+        self._shipping_throttle.start()
+    
+    @pyqtSlot()
+    def _on_shipping_throttle_timeout(self):
+        """Apply the last shipping change received during the throttle interval."""
+        if self._shipping_pending:
+            self._shipping_pending = False
+            self._trigger_preview()
+            self._shipping_throttle.start()
+    
+    @pyqtSlot()
     def _trigger_preview(self):
-        """Trigger preview update with delay."""
-        self._preview_timer.start(300)
+        """
+        Trigger counts and preview update with delay.
+        A half-resolution preview follows quickly, the full one once edits settle.
+        """
+        self._preview_timer.start(50)
+        self._full_preview_timer.start(400)
+    
+    @pyqtSlot()
+    def _deferred_update(self):
+        """Debounced refresh of counts, totals and a fast low-resolution preview."""
         self._update_counts()
+        self._update_preview(scale=0.5)
     
     def _update_counts(self):
         """Update product count and totals."""
         count = self.table.rowCount()
         self.products_count_label.setText(f"{count} producto{'s' if count != 1 else ''}")
         
-        # Calculate totals
-        data = self._collect_data()
-        subtotal = data['subtotal']
-        total = data['total']
-        shipping = data['shipping']
-        
-        self.subtotal_label.setText(f"{subtotal:.2f} {self.config.moneda}")
-        self.total_label.setText(f"{total:.2f} {self.config.moneda}")
-        
-        if shipping['enabled']:
-            self.shipping_display.setText(f"+ {shipping['amount']:.2f}")
+        # Totals come from the per-row amount cache, no full table scan
+        subtotal = self._subtotal
+        total = subtotal
+        if self.enable_shipping_check.isChecked():
+            shipping_amount = self.shipping_input.value()
+            total += shipping_amount
+            self.shipping_display.setText(f"+ {shipping_amount:.2f}")
         else:
             self.shipping_display.setText("+ 0.00")
         
+        self.subtotal_label.setText(f"{subtotal:.2f} {self._moneda}")
+        self.total_label.setText(f"{total:.2f} {self._moneda}")
+        
         # Update summary
         if count == 0:
             self.summary_label.setText("Sin productos agregados")
         else:
-            self.summary_label.setText(f"{count} productos • Subtotal: {subtotal:.2f} • Total: {total:.2f} {self.config.moneda}")
+            self.summary_label.setText(f"{count} productos • Subtotal: {subtotal:.2f} • Total: {total:.2f} {self._moneda}")
     
-    def _update_preview(self):
-        """Generate preview of products."""
+    @pyqtSlot()
+    def _update_preview(self, scale: float = 1.0):
+        """
+        Generate preview of products.
+        
+        Args:
+            scale: Rasterization scale; values below 1.0 render a cheaper preview
+                   that is upscaled to the same display size.
+        """
+        if not self._preview_built:
+            return
+        
         data = self._collect_data()
         products = data['products']
         shipping = data['shipping']
         
+        # Skip the render if nothing shown changed and the current preview is
+        # at least as sharp as the one requested
+        key = (
+            tuple(tuple(prod.items()) for prod in products),
+            tuple(shipping.items()),
+            data['total'],
+            self._moneda
+        )
+        if key == self._last_preview_key and scale <= self._last_preview_scale:
+            return
+        self._last_preview_key = key
+        self._last_preview_scale = scale
+        
         # Create preview pixmap
         width = 400
         row_height = 40
@@ -705,34 +1038,51 @@ class ProductsWindow(QMainWindow):
         height += row_height  # Total row
         height += 40  # Extra padding
         
-        pixmap = QPixmap(width, height)
-        pixmap.fill(QColor("#FFFFFF"))
+        # A full-scale render is handed to the label, which then shares it;
+        # refilling it next time would just detach into a new allocation, so
+        # only reduced-scale renders (upscaled into a separate pixmap for the
+        # label) reuse a buffer, unless the dimensions changed
+        buffer_size = QSize(int(width * scale), int(height * scale))
+        if scale == 1.0:
+            pixmap = QPixmap(buffer_size)
+        else:
+            pixmap = self._preview_pixmaps.get(scale)
+            if pixmap is None or pixmap.size() != buffer_size:
+                pixmap = QPixmap(buffer_size)
+                self._preview_pixmaps[scale] = pixmap
+        pixmap.fill(self._COL_BACKGROUND)
         
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if scale != 1.0:
+            painter.scale(scale, scale)
         
         y = padding
         
+        # Static text is positioned by its top-left corner, drawText by its
+        # baseline, so static labels are shifted up by the font ascent
+        
         # Header
-        painter.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        painter.setPen(QColor("#1D1D1F"))
-        painter.drawText(padding, y + 20, "Listado de Productos")
+        painter.setFont(self._FONT_TITLE)
+        painter.setPen(self._COL_TEXT)
+        ascent = painter.fontMetrics().ascent()
+        painter.drawStaticText(padding, y + 20 - ascent, self._STATIC_TITLE)
         y += header_height
         
         # Table header
-        painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        painter.fillRect(padding, y, width - padding * 2, row_height - 5, QColor("#F0F0F0"))
+        painter.setFont(self._FONT_BOLD)
+        painter.fillRect(padding, y, width - padding * 2, row_height - 5, self._COL_HEADER_BG)
         
-        col_widths = [160, 50, 50, 70, 70]
-        headers = ["Descripción", "Cant.", "Unid.", "P.Unit.", "Importe"]
+        col_widths = self._PREVIEW_COL_WIDTHS
+        ascent = painter.fontMetrics().ascent()
         x = padding + 5
-        for i, header in enumerate(headers):
-            painter.drawText(x, y + 25, header)
+        for i, header in enumerate(self._STATIC_HEADERS):
+            painter.drawStaticText(x, y + 25 - ascent, header)
             x += col_widths[i]
         y += row_height
         
         # Products
-        painter.setFont(QFont("Arial", 10))
+        painter.setFont(self._FONT_BODY)
         for prod in products:
             x = padding + 5
             values = [
@@ -748,44 +1098,57 @@ class ProductsWindow(QMainWindow):
             y += row_height
             
             # Separator line
-            painter.setPen(QPen(QColor("#E0E0E0"), 1))
+            painter.setPen(self._PEN_SEPARATOR)
             painter.drawLine(padding, y - 5, width - padding, y - 5)
-            painter.setPen(QColor("#1D1D1F"))
+            painter.setPen(self._COL_TEXT)
         
         if not products:
-            painter.setPen(QColor("#888888"))
-            painter.drawText(padding + 5, y + 25, "Sin productos")
+            painter.setPen(self._COL_MUTED)
+            ascent = painter.fontMetrics().ascent()
+            painter.drawStaticText(padding + 5, y + 25 - ascent, self._STATIC_NO_PRODUCTS)
             y += row_height
         
         y += 10
         
         # Shipping row
         if shipping['enabled']:
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            painter.setPen(QColor("#0A84FF"))
+            painter.setFont(self._FONT_BOLD)
+            painter.setPen(self._COL_ACCENT)
             painter.drawText(padding + 5, y + 20, f"Envío ({shipping['type']})")
             painter.drawText(width - padding - 70, y + 20, f"+ {shipping['amount']:.2f}")
             y += row_height
         
         # Total
-        painter.fillRect(padding, y, width - padding * 2, row_height, QColor("#34C759").lighter(170))
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.setPen(QColor("#1D1D1F"))
-        painter.drawText(padding + 5, y + 25, "TOTAL")
-        painter.drawText(width - padding - 100, y + 25, f"{data['total']:.2f} {self.config.moneda}")
+        painter.fillRect(padding, y, width - padding * 2, row_height, self._COL_TOTAL_BG)
+        painter.setFont(self._FONT_TOTAL)
+        painter.setPen(self._COL_TEXT)
+        ascent = painter.fontMetrics().ascent()
+        painter.drawStaticText(padding + 5, y + 25 - ascent, self._STATIC_TOTAL)
+        painter.drawText(width - padding - 100, y + 25, f"{data['total']:.2f} {self._moneda}")
         
         painter.end()
         
+        if scale != 1.0:
+            # Cheap nearest-neighbour upscale keeps the preview at a stable size
+            pixmap = pixmap.scaled(
+                width, height,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            )
+        
         self.preview_label.setPixmap(pixmap)
     
+    @pyqtSlot()
     def _mark_modified(self):
         """Mark data as modified."""
         self._is_modified = True
     
+    @pyqtSlot(str, str)
     def _show_warning(self, title, message):
         """Show warning toast."""
         self.toast.show_toast(title, message, self, duration=5000, type="warning")
     
+    @pyqtSlot()
     def _save_and_close(self):
         """Save data and close window."""
         data = self._collect_data()
@@ -793,10 +1156,17 @@ class ProductsWindow(QMainWindow):
         self._is_modified = False
         self.close()
     
+    @pyqtSlot()
     def _on_cancel(self):
         """Handle cancel button."""
         self.close()
     
+    def showEvent(self, event):
+        """Build the preview lazily the first time the window is shown."""
+        super().showEvent(event)
+        if not self._preview_built:
+            self._build_preview_panel()
+    
     def closeEvent(self, event):
         """Handle window close - auto-save if modified."""
         if self._is_modified:
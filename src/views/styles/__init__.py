@@ -1,31 +1,47 @@
 # Styles package - Theme and animation management
-from .theme_manager import ThemeManager, THEMES, Theme, load_themes
-from .theme_base import ThemeConfig, get_luminance, is_dark_theme, get_contrast_color
-from .animations import AnimationFactory, DURATIONS, EASINGS
+# Exports are resolved lazily (PEP 562) so importing one submodule does not
+# pull in every engine.
+import importlib
 
-# New theme engine
-from .theme_engine import ThemeEngine, ThemeData, get_theme_engine
-from .animation_engine import AnimationEngine, get_animation_engine, EASING_CURVES
-from .sound_manager import SoundManager, get_sound_manager
-from .effects_engine import EffectsEngine, get_effects_engine
-from .themeable import IThemeable, ComponentRegistry, get_component_registry
-from .layout_engine import LayoutEngine, LayoutConfig, get_layout_engine
-from .icon_manager import IconManager
-from .themeable_mixin import ThemeableMixin, make_themeable
-
-__all__ = [
+_LAZY = {
     # Legacy
-    'ThemeManager', 'THEMES', 'Theme', 'load_themes',
-    'ThemeConfig', 'get_luminance', 'is_dark_theme', 'get_contrast_color',
-    'AnimationFactory', 'DURATIONS', 'EASINGS',
+    'ThemeManager': 'theme_manager', 'THEMES': 'theme_manager',
+    'Theme': 'theme_manager', 'load_themes': 'theme_manager',
+    'ThemeConfig': 'theme_base', 'get_luminance': 'theme_base',
+    'is_dark_theme': 'theme_base', 'get_contrast_color': 'theme_base',
+    'AnimationFactory': 'animations', 'DURATIONS': 'animations', 'EASINGS': 'animations',
+    'DURATION_INSTANT': 'animations', 'DURATION_FAST': 'animations',
+    'DURATION_NORMAL': 'animations', 'DURATION_SLOW': 'animations',
+    'DURATION_VERY_SLOW': 'animations',
+    'EASING_SMOOTH': 'animations', 'EASING_BOUNCE': 'animations',
+    'EASING_ELASTIC': 'animations', 'EASING_OVERSHOOT': 'animations',
+    'EASING_LINEAR': 'animations', 'EASING_EASE_OUT': 'animations',
+    'EASING_EASE_IN': 'animations',
     # New system
-    'ThemeEngine', 'ThemeData', 'get_theme_engine',
-    'AnimationEngine', 'get_animation_engine', 'EASING_CURVES',
-    'SoundManager', 'get_sound_manager',
-    'EffectsEngine', 'get_effects_engine',
-    'IThemeable', 'ComponentRegistry', 'get_component_registry',
-    'LayoutEngine', 'LayoutConfig', 'get_layout_engine',
-    'IconManager',
-    'ThemeableMixin', 'make_themeable',
-]
+    'ThemeEngine': 'theme_engine', 'ThemeData': 'theme_engine', 'get_theme_engine': 'theme_engine',
+    'AnimationEngine': 'animation_engine', 'get_animation_engine': 'animation_engine',
+    'EASING_CURVES': 'animation_engine',
+    'SoundManager': 'sound_manager', 'get_sound_manager': 'sound_manager',
+    'EffectsEngine': 'effects_engine', 'get_effects_engine': 'effects_engine',
+    'IThemeable': 'themeable', 'ComponentRegistry': 'themeable',
+    'get_component_registry': 'themeable',
+    'LayoutEngine': 'layout_engine', 'LayoutConfig': 'layout_engine',
+    'get_layout_engine': 'layout_engine',
+    'IconManager': 'icon_manager',
+    'ThemeableMixin': 'themeable_mixin', 'make_themeable': 'themeable_mixin',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
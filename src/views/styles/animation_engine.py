@@ -3,37 +3,104 @@ Animation Engine - Centralized animation definitions with theme override support
 Provides base animations for all component types that can be customized by themes.
 """
 
-from typing import Dict, Any, Optional, Callable
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Tuple
 from PyQt6.QtCore import (
     QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
     QSequentialAnimationGroup, QAbstractAnimation, QObject, QPoint, QRect
 )
-from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
+from PyQt6.QtWidgets import QWidget
+
+from .animations import ensure_opacity_effect
 
 
 # Easing curve mappings
 EASING_CURVES = {
-    'Linear': QEasingCurve.Type.Linear,
-    'InQuad': QEasingCurve.Type.InQuad,
-    'OutQuad': QEasingCurve.Type.OutQuad,
-    'InOutQuad': QEasingCurve.Type.InOutQuad,
-    'InCubic': QEasingCurve.Type.InCubic,
-    'OutCubic': QEasingCurve.Type.OutCubic,
-    'InOutCubic': QEasingCurve.Type.InOutCubic,
-    'InQuart': QEasingCurve.Type.InQuart,
-    'OutQuart': QEasingCurve.Type.OutQuart,
-    'InOutQuart': QEasingCurve.Type.InOutQuart,
-    'InBack': QEasingCurve.Type.InBack,
-    'OutBack': QEasingCurve.Type.OutBack,
-    'InOutBack': QEasingCurve.Type.InOutBack,
-    'InBounce': QEasingCurve.Type.InBounce,
-    'OutBounce': QEasingCurve.Type.OutBounce,
-    'InOutBounce': QEasingCurve.Type.InOutBounce,
-    'InElastic': QEasingCurve.Type.InElastic,
-    'OutElastic': QEasingCurve.Type.OutElastic,
-    'InOutElastic': QEasingCurve.Type.InOutElastic,
+    name: getattr(QEasingCurve.Type, name)
+    for name in (
+        'Linear',
+        'InQuad', 'OutQuad', 'InOutQuad',
+        'InCubic', 'OutCubic', 'InOutCubic',
+        'InQuart', 'OutQuart', 'InOutQuart',
+        'InBack', 'OutBack', 'InOutBack',
+        'InBounce', 'OutBounce', 'InOutBounce',
+        'InElastic', 'OutElastic', 'InOutElastic',
+    )
 }
 
+_DEFAULT_EASING = QEasingCurve.Type.OutCubic
+_easing_lookup = EASING_CURVES.__getitem__
+
+
+def _resolve_easing(easing) -> QEasingCurve.Type:
+    """Resolve an easing name to its curve type, falling back to OutCubic."""
+    try:
+        return _easing_lookup(easing)
+    except KeyError:
+        if isinstance(easing, QEasingCurve.Type):
+            return easing
+        return _DEFAULT_EASING
+
+
+@dataclass(frozen=True, slots=True)
+class AnimConfig:
+    """
+    Immutable, pre-resolved animation config.
+    
+    params holds the positional arguments specific to the animation type:
+    fade/scale_fade -> (from_opacity, to_opacity),
+    slide -> (direction, distance, reverse).
+    """
+    type: Optional[str]
+    duration: int
+    easing: QEasingCurve.Type
+    params: tuple = ()
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'AnimConfig':
+        """Build an AnimConfig from a raw config dict."""
+        anim_type = config.get('type')
+        if anim_type == 'fade':
+            params = (config.get('from', 0.0), config.get('to', 1.0))
+        elif anim_type == 'slide':
+            params = (
+                config.get('direction', 'left'),
+                config.get('distance', 100),
+                config.get('reverse', False)
+            )
+        elif anim_type == 'scale_fade':
+            params = (config.get('from_opacity', 0.0), config.get('to_opacity', 1.0))
+        else:
+            params = ()
+        return cls(
+            anim_type,
+            config.get('duration', 250),
+            _resolve_easing(config.get('easing', 'OutCubic')),
+            params
+        )
+
+# Unit offsets for slide directions (unknown directions do not move)
+_SLIDE_DIRECTIONS = {
+    'left': (-1, 0),
+    'right': (1, 0),
+    'top': (0, -1),
+    'bottom': (0, 1),
+}
+
+def _freeze(value):
+    """Recursively wrap dicts as read-only views and intern string values."""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Shared result for unknown component/animation pairs
+_EMPTY = MappingProxyType({})
+
 
 class AnimationEngine:
     """
@@ -41,7 +108,8 @@ class AnimationEngine:
     Provides factory methods for creating Qt animations from theme configs.
     """
     
-    _instance = None
+    # Animation type -> creator, registered after the class body
+    _CREATORS: Dict[str, Callable] = {}
     
     # Base animation definitions by component type
     BASE_ANIMATIONS = {
@@ -183,21 +251,41 @@ class AnimationEngine:
     def __init__(self):
         self._custom_overrides: Dict[str, Dict] = {}
         self._global_speed: float = 1.0
+        self._merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._configs: Dict[Tuple[str, str], AnimConfig] = {}
+        self._rebuild_merged()
     
     @classmethod
     def get_instance(cls) -> 'AnimationEngine':
         """Get singleton instance."""
-        if cls._instance is None:
-            cls._instance = AnimationEngine()
-        return cls._instance
+        return _ENGINE
     
     def set_global_speed(self, speed: float):
         """Set global animation speed multiplier (1.0 = normal, 2.0 = 2x faster)."""
         self._global_speed = max(0.1, min(5.0, speed))
+        self._rebuild_merged()
     
     def set_custom_overrides(self, overrides: Dict[str, Dict]):
         """Set custom animation overrides from theme config."""
         self._custom_overrides = overrides or {}
+        self._rebuild_merged()
+    
+    def _rebuild_merged(self):
+        """Precompute base + override configs with global speed applied."""
+        merged = {}
+        for component_type, animations in self.BASE_ANIMATIONS.items():
+            overrides = self._custom_overrides.get(component_type, {})
+            for animation_name, base in animations.items():
+                # Merge configs (custom overrides base)
+                config = {**base, **overrides.get(animation_name, {})}
+                
+                # Apply global speed
+                if 'duration' in config:
+                    config['duration'] = int(config['duration'] / self._global_speed)
+                
+                merged[(component_type, animation_name)] = config
+        self._merged = merged
+        self._configs = {key: AnimConfig.from_dict(config) for key, config in merged.items()}
     
     def get_animation_config(self, component_type: str, animation_name: str) -> Dict[str, Any]:
         """
@@ -208,24 +296,13 @@ class AnimationEngine:
             animation_name: Name of animation (hover, press, show, etc.)
         
         Returns:
-            Animation configuration dict
+            Animation configuration dict (shared, do not modify)
         """
-        # Get base animation
-        base = self.BASE_ANIMATIONS.get(component_type, {}).get(animation_name, {})
-        if not base:
-            return {}
-        
-        # Apply custom overrides if present
-        custom = self._custom_overrides.get(component_type, {}).get(animation_name, {})
-        
-        # Merge configs (custom overrides base)
-        config = {**base, **custom}
-        
-        # Apply global speed
-        if 'duration' in config:
-            config['duration'] = int(config['duration'] / self._global_speed)
-        
-        return config
+        return self._merged.get((component_type, animation_name), _EMPTY)
+    
+    def get_anim_config(self, component_type: str, animation_name: str) -> Optional[AnimConfig]:
+        """Get the precomputed AnimConfig for a component animation, if any."""
+        return self._configs.get((component_type, animation_name))
     
     def create_fade_animation(
         self,
@@ -236,16 +313,13 @@ class AnimationEngine:
         easing: str = 'OutCubic'
     ) -> QPropertyAnimation:
         """Create a fade in/out animation."""
-        effect = widget.graphicsEffect()
-        if not isinstance(effect, QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
+        effect = ensure_opacity_effect(widget)
         
         anim = QPropertyAnimation(effect, b"opacity")
         anim.setDuration(int(duration / self._global_speed))
         anim.setStartValue(from_opacity)
         anim.setEndValue(to_opacity)
-        anim.setEasingCurve(EASING_CURVES.get(easing, QEasingCurve.Type.OutCubic))
+        anim.setEasingCurve(_resolve_easing(easing))
         
         return anim
     
@@ -261,26 +335,17 @@ class AnimationEngine:
         """Create a slide animation."""
         anim = QPropertyAnimation(widget, b"pos")
         anim.setDuration(int(duration / self._global_speed))
-        anim.setEasingCurve(EASING_CURVES.get(easing, QEasingCurve.Type.OutCubic))
+        anim.setEasingCurve(_resolve_easing(easing))
         
         current_pos = widget.pos()
-        
-        if direction == 'left':
-            offset = QPoint(-distance, 0)
-        elif direction == 'right':
-            offset = QPoint(distance, 0)
-        elif direction == 'top':
-            offset = QPoint(0, -distance)
-        elif direction == 'bottom':
-            offset = QPoint(0, distance)
-        else:
-            offset = QPoint(0, 0)
+        dx, dy = _SLIDE_DIRECTIONS.get(direction, (0, 0))
+        offset_pos = current_pos + QPoint(dx * distance, dy * distance)
         
         if reverse:
             anim.setStartValue(current_pos)
-            anim.setEndValue(current_pos + offset)
+            anim.setEndValue(offset_pos)
         else:
-            anim.setStartValue(current_pos + offset)
+            anim.setStartValue(offset_pos)
             anim.setEndValue(current_pos)
         
         return anim
@@ -297,7 +362,7 @@ class AnimationEngine:
         anim.setDuration(int(duration / self._global_speed))
         anim.setStartValue(widget.geometry())
         anim.setEndValue(target_geometry)
-        anim.setEasingCurve(EASING_CURVES.get(easing, QEasingCurve.Type.OutCubic))
+        anim.setEasingCurve(_resolve_easing(easing))
         
         return anim
     
@@ -320,54 +385,57 @@ class AnimationEngine:
     def create_from_config(
         self,
         widget: QWidget,
-        config: Dict[str, Any]
+        config
     ) -> Optional[QAbstractAnimation]:
         """
-        Create animation from a configuration dict.
+        Create animation from a configuration.
         
         Args:
             widget: Target widget
-            config: Animation configuration
+            config: AnimConfig, or a raw animation configuration dict
         
         Returns:
             QAbstractAnimation or None if config is invalid
         """
-        anim_type = config.get('type')
-        duration = config.get('duration', 250)
-        easing = config.get('easing', 'OutCubic')
-        
-        if anim_type == 'fade':
-            return self.create_fade_animation(
-                widget,
-                config.get('from', 0.0),
-                config.get('to', 1.0),
-                duration,
-                easing
-            )
-        elif anim_type == 'slide':
-            return self.create_slide_animation(
-                widget,
-                config.get('direction', 'left'),
-                config.get('distance', 100),
-                duration,
-                easing,
-                config.get('reverse', False)
-            )
-        elif anim_type == 'scale_fade':
-            # Combined scale and fade
-            fade_anim = self.create_fade_animation(
-                widget,
-                config.get('from_opacity', 0.0),
-                config.get('to_opacity', 1.0),
-                duration,
-                easing
-            )
-            return fade_anim  # Scale handled in paintEvent
-        
-        return None
+        if not isinstance(config, AnimConfig):
+            config = AnimConfig.from_dict(config)
+        creator = self._CREATORS.get(config.type)
+        return creator(self, widget, config) if creator else None
+    
+    def _make_fade(self, widget: QWidget, config: AnimConfig) -> QPropertyAnimation:
+        """Create a fade animation from an AnimConfig."""
+        from_opacity, to_opacity = config.params
+        return self.create_fade_animation(
+            widget, from_opacity, to_opacity, config.duration, config.easing
+        )
+    
+    def _make_slide(self, widget: QWidget, config: AnimConfig) -> QPropertyAnimation:
+        """Create a slide animation from an AnimConfig."""
+        direction, distance, reverse = config.params
+        return self.create_slide_animation(
+            widget, direction, distance, config.duration, config.easing, reverse
+        )
+    
+    def _make_scale_fade(self, widget: QWidget, config: AnimConfig) -> QPropertyAnimation:
+        """Create a combined scale and fade (scale is handled in paintEvent)."""
+        return self._make_fade(widget, config)
+
+
+# Animation type -> creator dispatch table
+AnimationEngine._CREATORS = {
+    'fade': AnimationEngine._make_fade,
+    'slide': AnimationEngine._make_slide,
+    'scale_fade': AnimationEngine._make_scale_fade,
+}
+
+# Base definitions are read-only; overrides are merged into fresh dicts
+AnimationEngine.BASE_ANIMATIONS = _freeze(AnimationEngine.BASE_ANIMATIONS)
+
+
+# Global instance (holds no Qt objects, so it is safe to build at import)
+_ENGINE = AnimationEngine()
 
 
-# Global instance
 def get_animation_engine() -> AnimationEngine:
     """Get the global animation engine instance."""
-    return AnimationEngine.get_instance()
+    return _ENGINE
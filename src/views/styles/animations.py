@@ -5,41 +5,73 @@ Provides reusable animation factories and timing configurations.
 
 from PyQt6.QtCore import (
     QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
-    QSequentialAnimationGroup, QAbstractAnimation
+    QSequentialAnimationGroup, QAbstractAnimation, QRect
 )
 from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
 
 
 # Animation duration constants (milliseconds)
+DURATION_INSTANT = 50
+DURATION_FAST = 150
+DURATION_NORMAL = 250
+DURATION_SLOW = 400
+DURATION_VERY_SLOW = 600
+
 DURATIONS = {
-    'instant': 50,
-    'fast': 150,
-    'normal': 250,
-    'slow': 400,
-    'very_slow': 600
+    'instant': DURATION_INSTANT,
+    'fast': DURATION_FAST,
+    'normal': DURATION_NORMAL,
+    'slow': DURATION_SLOW,
+    'very_slow': DURATION_VERY_SLOW
 }
 
 # Easing curve presets
+EASING_SMOOTH = QEasingCurve.Type.InOutCubic
+EASING_BOUNCE = QEasingCurve.Type.OutBounce
+EASING_ELASTIC = QEasingCurve.Type.OutElastic
+EASING_OVERSHOOT = QEasingCurve.Type.OutBack
+EASING_LINEAR = QEasingCurve.Type.Linear
+EASING_EASE_OUT = QEasingCurve.Type.OutCubic
+EASING_EASE_IN = QEasingCurve.Type.InCubic
+
 EASINGS = {
-    'smooth': QEasingCurve.Type.InOutCubic,
-    'bounce': QEasingCurve.Type.OutBounce,
-    'elastic': QEasingCurve.Type.OutElastic,
-    'overshoot': QEasingCurve.Type.OutBack,
-    'linear': QEasingCurve.Type.Linear,
-    'ease_out': QEasingCurve.Type.OutCubic,
-    'ease_in': QEasingCurve.Type.InCubic
+    'smooth': EASING_SMOOTH,
+    'bounce': EASING_BOUNCE,
+    'elastic': EASING_ELASTIC,
+    'overshoot': EASING_OVERSHOOT,
+    'linear': EASING_LINEAR,
+    'ease_out': EASING_EASE_OUT,
+    'ease_in': EASING_EASE_IN
 }
 
 
+def ensure_opacity_effect(widget: QWidget) -> QGraphicsOpacityEffect:
+    """
+    Return the widget's opacity effect, attaching one only when needed.
+    The effect is cached on the widget so repeated fades reuse it.
+    """
+    effect = getattr(widget, '_opacity_effect', None)
+    current = widget.graphicsEffect()
+    # Qt deletes the effect if another one replaces it; only trust the cache
+    # while it is still the installed effect.
+    if effect is None or current is not effect:
+        if isinstance(current, QGraphicsOpacityEffect):
+            effect = current
+        else:
+            effect = QGraphicsOpacityEffect(widget)
+            widget.setGraphicsEffect(effect)
+        widget._opacity_effect = effect
+    return effect
+
+
 class AnimationFactory:
     """Factory class for creating reusable animations."""
     
     @staticmethod
-    def fade_in(widget: QWidget, duration: int = DURATIONS['normal'], 
-                easing: QEasingCurve.Type = EASINGS['smooth']) -> QPropertyAnimation:
+    def fade_in(widget: QWidget, duration: int = DURATION_NORMAL, 
+                easing: QEasingCurve.Type = EASING_SMOOTH) -> QPropertyAnimation:
         """Create a fade-in animation for a widget."""
-        effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
+        effect = ensure_opacity_effect(widget)
         
         animation = QPropertyAnimation(effect, b"opacity")
         animation.setDuration(duration)
@@ -50,13 +82,10 @@ class AnimationFactory:
         return animation
     
     @staticmethod
-    def fade_out(widget: QWidget, duration: int = DURATIONS['normal'],
-                 easing: QEasingCurve.Type = EASINGS['smooth']) -> QPropertyAnimation:
+    def fade_out(widget: QWidget, duration: int = DURATION_NORMAL,
+                 easing: QEasingCurve.Type = EASING_SMOOTH) -> QPropertyAnimation:
         """Create a fade-out animation for a widget."""
-        effect = widget.graphicsEffect()
-        if not isinstance(effect, QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
+        effect = ensure_opacity_effect(widget)
         
         animation = QPropertyAnimation(effect, b"opacity")
         animation.setDuration(duration)
@@ -68,22 +97,24 @@ class AnimationFactory:
     
     @staticmethod
     def scale(widget: QWidget, start_scale: float = 1.0, end_scale: float = 1.05,
-              duration: int = DURATIONS['fast'],
-              easing: QEasingCurve.Type = EASINGS['smooth']) -> QPropertyAnimation:
+              duration: int = DURATION_FAST,
+              easing: QEasingCurve.Type = EASING_SMOOTH) -> QPropertyAnimation:
         """Create a scale animation using geometry."""
         animation = QPropertyAnimation(widget, b"geometry")
         animation.setDuration(duration)
         
-        original_geometry = widget.geometry()
+        geometry = widget.geometry()
+        center = geometry.center()
+        width = geometry.width()
+        height = geometry.height()
         
-        # Calculate scaled geometries
-        center_x = original_geometry.center().x()
-        center_y = original_geometry.center().y()
-        
-        start_width = int(original_geometry.width() * start_scale)
-        start_height = int(original_geometry.height() * start_scale)
-        end_width = int(original_geometry.width() * end_scale)
-        end_height = int(original_geometry.height() * end_scale)
+        # Scaled geometries keep the widget centered
+        start_rect = QRect(0, 0, int(width * start_scale), int(height * start_scale))
+        start_rect.moveCenter(center)
+        end_rect = QRect(0, 0, int(width * end_scale), int(height * end_scale))
+        end_rect.moveCenter(center)
+        animation.setStartValue(start_rect)
+        animation.setEndValue(end_rect)
         
         animation.setEasingCurve(easing)
         
@@ -91,8 +122,8 @@ class AnimationFactory:
     
     @staticmethod
     def slide_in(widget: QWidget, direction: str = 'left',
-                 duration: int = DURATIONS['normal'],
-                 easing: QEasingCurve.Type = EASINGS['ease_out']) -> QPropertyAnimation:
+                 duration: int = DURATION_NORMAL,
+                 easing: QEasingCurve.Type = EASING_EASE_OUT) -> QPropertyAnimation:
         """Create a slide-in animation from a direction."""
         animation = QPropertyAnimation(widget, b"pos")
         animation.setDuration(duration)
@@ -117,7 +148,7 @@ class AnimationFactory:
     @staticmethod
     def color_transition_stylesheet(widget: QWidget, property_name: str,
                                     start_color: str, end_color: str,
-                                    duration: int = DURATIONS['normal']) -> QPropertyAnimation:
+                                    duration: int = DURATION_NORMAL) -> QPropertyAnimation:
         """
         Creates animation data for color transitions.
         Note: StyleSheet animations require manual interpolation.
@@ -143,27 +174,43 @@ class AnimationFactory:
 
 
 class HoverAnimationMixin:
-    """Mixin class to add hover animations to widgets."""
+    """
+    Mixin class to add hover animations to widgets.
+    Both styles are installed once as a single stylesheet keyed on a
+    'hovered' dynamic property, so hovering only re-polishes the widget
+    instead of re-parsing a stylesheet on every mouse cross.
+    """
     
     _hover_animation: QPropertyAnimation = None
-    _normal_style: str = ""
-    _hover_style: str = ""
+    _hover_enabled: bool = False
     
     def setup_hover_animation(self, normal_style: str, hover_style: str):
-        """Setup the hover animation with normal and hover styles."""
-        self._normal_style = normal_style
-        self._hover_style = hover_style
+        """Setup the hover animation with normal and hover styles (declarations only)."""
+        selector = self.metaObject().className()
+        self.setStyleSheet(
+            f'{selector}[hovered="false"] {{ {normal_style} }}\n'
+            f'{selector}[hovered="true"] {{ {hover_style} }}'
+        )
+        self._hover_enabled = True
+        self._set_hovered(False)
+    
+    def _set_hovered(self, hovered: bool):
+        """Toggle the hovered property and re-polish with the cached stylesheet."""
+        self.setProperty('hovered', hovered)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
     
     def enterEvent(self, event):
         """Handle mouse enter."""
-        if hasattr(self, '_hover_style') and self._hover_style:
-            self.setStyleSheet(self._hover_style)
+        if self._hover_enabled:
+            self._set_hovered(True)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Handle mouse leave."""
-        if hasattr(self, '_normal_style') and self._normal_style:
-            self.setStyleSheet(self._normal_style)
+        if self._hover_enabled:
+            self._set_hovered(False)
         super().leaveEvent(event)
 
 
@@ -3,13 +3,223 @@ Effects Engine - Visual effects manager for themed components.
 Handles blur, bloom, glow, shadows, gradients, and transparency effects.
 """
 
+import json
+import math
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
-from PyQt6.QtCore import Qt, QRectF
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QRectF, QPointF, QEvent, QObject, QTimer
 from PyQt6.QtGui import (
     QColor, QPainter, QLinearGradient, QRadialGradient,
-    QBrush, QPen, QPainterPath
+    QBrush, QPen, QPainterPath, QPixmap, QImage
 )
-from PyQt6.QtWidgets import QWidget, QGraphicsDropShadowEffect, QGraphicsBlurEffect
+from PyQt6.QtWidgets import (
+    QWidget, QGraphicsDropShadowEffect, QGraphicsBlurEffect,
+    QGraphicsScene, QGraphicsPathItem
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_color_cached(color_str: str) -> QColor:
+    """
+    Parse a color string to QColor.
+    The result is shared between callers and must not be modified.
+    """
+    if not color_str:
+        return QColor(255, 255, 255)
+    
+    if color_str.startswith('rgba('):
+        # Parse rgba(r, g, b, a)
+        parts = color_str.replace('rgba(', '').replace(')', '').split(',')
+        r = int(parts[0].strip())
+        g = int(parts[1].strip())
+        b = int(parts[2].strip())
+        a = float(parts[3].strip())
+        color = QColor(r, g, b)
+        color.setAlphaF(a)
+        return color
+    elif color_str.startswith('rgb('):
+        # Parse rgb(r, g, b)
+        parts = color_str.replace('rgb(', '').replace(')', '').split(',')
+        r = int(parts[0].strip())
+        g = int(parts[1].strip())
+        b = int(parts[2].strip())
+        return QColor(r, g, b)
+    else:
+        # Hex color
+        return QColor(color_str)
+
+
+@lru_cache(maxsize=64)
+def _glow_alphas(intensity: float, radius: int) -> Tuple[int, ...]:
+    """Integer alpha per draw_glow layer i (0..radius-1)."""
+    return tuple(
+        min(255, max(0, round(255 * intensity * (1.0 - i / radius) * 0.5)))
+        for i in range(radius)
+    )
+
+
+@lru_cache(maxsize=64)
+def _neon_alphas(intensity: float, layers: int) -> Tuple[int, ...]:
+    """Integer alpha per draw_neon_glow layer, indexed by layer number (1..layers)."""
+    return (0,) + tuple(
+        round(255 * max(0, min(1, intensity * (1.0 - i / layers) * 0.4)))
+        for i in range(1, layers + 1)
+    )
+
+
+def _glass_reflection_baked(height: float, top: float) -> bool:
+    """
+    Whether draw_glass_background's top reflection fits in the gradient.
+    The baked band must end before the fixed 0.1 stop; on short panels it
+    would not, and the reflection is drawn as a line instead.
+    """
+    return height > 0 and (top + 2.5) / height < 0.1
+
+
+@lru_cache(maxsize=64)
+def _glass_gradient_stops(height: float, top: float, opacity: float) -> Tuple[Tuple[float, QColor], ...]:
+    """Gradient stops for draw_glass_background, shared by equal panels."""
+    top_alpha = int(255 * opacity * 1.5)
+    stops = [(0.0, QColor(255, 255, 255, top_alpha))]
+    
+    # Top reflection: a 1px antialiased line at top + 1 lights the two
+    # pixel rows it straddles at half strength; bake that band into the
+    # fill so the panel is a single drawPath
+    if _glass_reflection_baked(height, top):
+        band_end = (top + 2) / height
+        highlight = QColor(255, 255, 255, top_alpha + 20 - top_alpha * 20 // 255)
+        stops = [
+            (0.0, highlight),
+            (band_end, highlight),
+            (band_end + 0.5 / height, QColor(255, 255, 255, top_alpha)),
+        ]
+    
+    stops.append((0.1, QColor(255, 255, 255, int(255 * opacity))))
+    stops.append((0.5, QColor(255, 255, 255, int(255 * opacity * 0.7))))
+    stops.append((1.0, QColor(0, 0, 0, int(255 * opacity * 0.5))))
+    return tuple(stops)
+
+
+# Depth overlay used by draw_frosted_glass
+_FROSTED_GRADIENT_STOPS = (
+    (0.0, QColor(255, 255, 255, int(255 * 0.1))),
+    (0.5, QColor(255, 255, 255, int(255 * 0.02))),
+    (1.0, QColor(0, 0, 0, int(255 * 0.05))),
+)
+_FROSTED_EDGE_COLOR = QColor(255, 255, 255, 30)
+
+
+_ANTIALIASING = QPainter.RenderHint.Antialiasing
+
+
+def _ensure_antialiasing(painter: QPainter):
+    """
+    Enable antialiasing only if it is off. QPainter marks its hint state
+    dirty on every setRenderHint call, even when nothing changes.
+    """
+    if not painter.testRenderHint(_ANTIALIASING):
+        painter.setRenderHint(_ANTIALIASING)
+
+
+class _ShadowOverlay(QWidget):
+    """
+    Sibling widget stacked under its target that paints a prerendered
+    drop shadow, so the target itself is rendered without a graphics effect.
+    """
+    
+    def __init__(self, engine: 'EffectsEngine', target: QWidget, config: Dict[str, Any]):
+        super().__init__(target.parentWidget())
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._engine = engine
+        self._target = target
+        self._pixmap = None
+        self._pixmap_size = None
+        # While the target is being resized the last shadow is stretched and
+        # only re-rendered once the size settles
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(_SHADOW_RESIZE_SETTLE_MS)
+        self._render_timer.timeout.connect(self._render)
+        self.set_config(config)
+        target.installEventFilter(self)
+        target.destroyed.connect(self.deleteLater)
+    
+    def set_config(self, config: Dict[str, Any]):
+        """Update shadow parameters and re-sync with the target."""
+        self._blur = math.ceil(config.get('blur_radius', 15))
+        self._offset_x = config.get('offset_x', 0)
+        self._offset_y = config.get('offset_y', 4)
+        self._color = config.get('color', 'rgba(0,0,0,0.4)')
+        self._corner_radius = config.get('corner_radius', _SHADOW_CORNER_RADIUS)
+        self._pixmap_size = None
+        self._sync()
+    
+    def _sync(self):
+        """Follow the target's geometry, visibility and stacking order."""
+        target = self._target
+        blur = self._blur
+        self.setGeometry(
+            target.geometry()
+            .translated(int(self._offset_x), int(self._offset_y))
+            .adjusted(-blur, -blur, blur, blur)
+        )
+        if self._pixmap is None or self._pixmap_size is None:
+            self._render()
+        elif self._pixmap_size != (target.width(), target.height(), target.devicePixelRatioF()):
+            self._render_timer.start()
+        self.setVisible(target.isVisible())
+        self.stackUnder(target)
+        self.update()
+    
+    def _render(self):
+        """Fetch the shadow for the target's current size."""
+        self._render_timer.stop()
+        target = self._target
+        self._pixmap_size = (target.width(), target.height(), target.devicePixelRatioF())
+        self._pixmap = self._engine._get_cached_shadow_pixmap(
+            target.width(), target.height(), self._blur,
+            self._offset_x, self._offset_y, self._color,
+            target.devicePixelRatioF(), self._corner_radius
+        )
+        self.update()
+    
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() in _SHADOW_SYNC_EVENTS:
+            self._sync()
+        return False
+    
+    def paintEvent(self, event):
+        if self._pixmap is not None:
+            # Stretched to the current rect while a resize is settling
+            QPainter(self).drawPixmap(self.rect(), self._pixmap)
+
+
+# Unit-circle vertex directions for the polygon shapes, starting at the top
+_HEXAGON_VERTICES = tuple(
+    (math.cos(math.pi / 3 * i - math.pi / 2), math.sin(math.pi / 3 * i - math.pi / 2))
+    for i in range(6)
+)
+_STAR_VERTICES = tuple(
+    (math.cos(math.pi / 5 * i - math.pi / 2), math.sin(math.pi / 5 * i - math.pi / 2))
+    for i in range(10)
+)
+
+# Corner radius of the prerendered shadow (the themes' default medium radius)
+_SHADOW_CORNER_RADIUS = 8
+
+# Quiet time after the last resize before a new shadow size is rendered
+_SHADOW_RESIZE_SETTLE_MS = 50
+
+# Prerendered pixmaps kept per cache (least recently used are dropped)
+_PIXMAP_CACHE_SIZE = 64
+
+# Target events that require the shadow overlay to follow
+_SHADOW_SYNC_EVENTS = frozenset((
+    QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.Show,
+    QEvent.Type.Hide, QEvent.Type.ZOrderChange
+))
 
 
 class EffectsEngine:
@@ -19,6 +229,15 @@ class EffectsEngine:
     """
     
     _instance = None
+    _instance_lock = threading.Lock()
+    
+    # Light gradient start/end as (x1, y1, x2, y2) fractions of the rect
+    _LIGHT_DIRS = {
+        'top': (0, 0, 0, 1),
+        'bottom': (0, 1, 0, 0),
+        'left': (0, 0, 1, 0),
+        'right': (1, 0, 0, 0),
+    }
     
     def __init__(self):
         self._blur_enabled = True
@@ -34,14 +253,29 @@ class EffectsEngine:
             'blur_radius': 15,
             'offset_x': 0,
             'offset_y': 4,
-            'color': 'rgba(0, 0, 0, 0.4)'
+            'color': 'rgba(0, 0, 0, 0.4)',
+            'corner_radius': _SHADOW_CORNER_RADIUS
         }
+        
+        # Vector shape paths built at the origin, keyed by (shape, width, height)
+        self._shape_path_cache: Dict[Tuple[str, float, float], QPainterPath] = {}
+        
+        # Prerendered glow layers, keyed by style, size and device pixel ratio
+        self._glow_pixmap_cache: 'OrderedDict[Tuple, QPixmap]' = OrderedDict()
+        
+        # Prerendered drop shadows, keyed by size, shadow config and pixel ratio
+        self._shadow_pixmap_cache: 'OrderedDict[Tuple, QPixmap]' = OrderedDict()
+        
+        # Serialized config from the last configure() call
+        self._config_signature: Optional[str] = None
     
     @classmethod
     def get_instance(cls) -> 'EffectsEngine':
         """Get singleton instance."""
         if cls._instance is None:
-            cls._instance = EffectsEngine()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = EffectsEngine()
         return cls._instance
     
     def configure(self, config: Dict[str, Any]):
@@ -51,12 +285,24 @@ class EffectsEngine:
         Args:
             config: Effects configuration from theme JSON
         """
-        self._blur_enabled = config.get('blur', {}).get('enabled', True)
-        self._default_blur_radius = config.get('blur', {}).get('radius', 12)
+        # Theme reloads often pass the same effects; skip no-op reconfigures
+        signature = json.dumps(config, sort_keys=True, default=str)
+        if signature == self._config_signature:
+            return
+        self._config_signature = signature
+        
+        # Prerendered pixmaps belong to the previous theme's look
+        self._glow_pixmap_cache.clear()
+        self._shadow_pixmap_cache.clear()
         
-        self._glow_enabled = config.get('glow', {}).get('enabled', True)
-        self._default_glow_color = config.get('glow', {}).get('color', '#0A84FF')
-        self._default_glow_intensity = config.get('glow', {}).get('intensity', 0.4)
+        blur = config.get('blur') or {}
+        self._blur_enabled = blur.get('enabled', True)
+        self._default_blur_radius = blur.get('radius', 12)
+        
+        glow = config.get('glow') or {}
+        self._glow_enabled = glow.get('enabled', True)
+        self._default_glow_color = glow.get('color', '#0A84FF')
+        self._default_glow_intensity = glow.get('intensity', 0.4)
         
         self._transparency_enabled = config.get('transparency', 0) > 0
         self._shadow_enabled = True  # Always available
@@ -95,45 +341,138 @@ class EffectsEngine:
     def apply_shadow(
         self,
         widget: QWidget,
-        config: Dict[str, Any] = None
-    ) -> Optional[QGraphicsDropShadowEffect]:
+        config: Dict[str, Any] = None,
+        animated: bool = False
+    ) -> Optional[QObject]:
         """
         Apply drop shadow effect to widget.
         
+        Static widgets get a prerendered shadow painted by an overlay stacked
+        under them, which avoids re-rasterizing the widget offscreen on every
+        repaint. Animated or top-level widgets keep a QGraphicsDropShadowEffect.
+        
         Args:
             widget: Target widget
             config: Shadow configuration (uses defaults if None)
+            animated: Use a live graphics effect instead of a cached shadow
         
         Returns:
-            The shadow effect if applied
+            The shadow overlay or effect if applied
         """
         if not self._shadow_enabled:
             return None
         
         cfg = config or self._default_shadow_config
         
-        effect = QGraphicsDropShadowEffect(widget)
+        overlay = getattr(widget, '_shadow_overlay', None)
+        if not animated and widget.parentWidget() is not None:
+            if isinstance(widget.graphicsEffect(), QGraphicsDropShadowEffect):
+                widget.setGraphicsEffect(None)
+            if overlay is None:
+                overlay = _ShadowOverlay(self, widget, cfg)
+                widget._shadow_overlay = overlay
+            else:
+                overlay.set_config(cfg)
+            return overlay
+        
+        if overlay is not None:
+            widget.removeEventFilter(overlay)
+            overlay.deleteLater()
+            widget._shadow_overlay = None
+        
+        # Qt effects cannot be shared between widgets; reuse the installed one
+        effect = widget.graphicsEffect()
+        if not isinstance(effect, QGraphicsDropShadowEffect):
+            effect = QGraphicsDropShadowEffect(widget)
+            widget.setGraphicsEffect(effect)
+        
         effect.setBlurRadius(cfg.get('blur_radius', 15))
         effect.setXOffset(cfg.get('offset_x', 0))
         effect.setYOffset(cfg.get('offset_y', 4))
         effect.setColor(self._parse_color(cfg.get('color', 'rgba(0,0,0,0.4)')))
-        
-        widget.setGraphicsEffect(effect)
         return effect
     
+    def _get_cached_shadow_pixmap(
+        self,
+        width: int,
+        height: int,
+        blur_radius: int,
+        offset_x: float,
+        offset_y: float,
+        color: str,
+        dpr: float = 1.0,
+        corner_radius: float = _SHADOW_CORNER_RADIUS
+    ) -> QPixmap:
+        """
+        Get a drop shadow for a width x height rounded rect, padded by
+        blur_radius. Rendered once through Qt's own drop shadow so it
+        matches the effect.
+        """
+        key = (width, height, blur_radius, offset_x, offset_y, color, dpr, corner_radius)
+        pixmap = self._shadow_pixmap_cache.get(key)
+        if pixmap is not None:
+            self._shadow_pixmap_cache.move_to_end(key)
+            return pixmap
+        
+        # Blurred silhouette of the widget's rounded rect, rendered via a
+        # throwaway scene
+        radius = min(corner_radius, width / 2, height / 2)
+        shape = QPainterPath()
+        shape.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
+        scene = QGraphicsScene()
+        item = QGraphicsPathItem(shape)
+        item.setBrush(QBrush(Qt.GlobalColor.black))
+        item.setPen(QPen(Qt.PenStyle.NoPen))
+        effect = QGraphicsDropShadowEffect()
+        effect.setBlurRadius(blur_radius)
+        effect.setOffset(offset_x, offset_y)
+        effect.setColor(self._parse_color(color))
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+        
+        source = QRectF(
+            offset_x - blur_radius, offset_y - blur_radius,
+            width + blur_radius * 2, height + blur_radius * 2
+        )
+        image = QImage(
+            math.ceil(source.width() * dpr), math.ceil(source.height() * dpr),
+            QImage.Format.Format_ARGB32_Premultiplied
+        )
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(image)
+        scene.render(painter, QRectF(0, 0, source.width(), source.height()), source)
+        # The widget covers its own shape; keep only the shadow around it
+        painter.setRenderHint(_ANTIALIASING)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+        painter.fillPath(
+            shape.translated(blur_radius - offset_x, blur_radius - offset_y),
+            Qt.GlobalColor.transparent
+        )
+        painter.end()
+        
+        pixmap = QPixmap.fromImage(image)
+        self._shadow_pixmap_cache[key] = pixmap
+        if len(self._shadow_pixmap_cache) > _PIXMAP_CACHE_SIZE:
+            self._shadow_pixmap_cache.popitem(last=False)
+        return pixmap
+    
     def create_shadow_config(
         self,
         blur_radius: int = 15,
         offset_x: int = 0,
         offset_y: int = 4,
-        color: str = 'rgba(0, 0, 0, 0.4)'
+        color: str = 'rgba(0, 0, 0, 0.4)',
+        corner_radius: float = _SHADOW_CORNER_RADIUS
     ) -> Dict[str, Any]:
         """Create a shadow configuration dict."""
         return {
             'blur_radius': blur_radius,
             'offset_x': offset_x,
             'offset_y': offset_y,
-            'color': color
+            'color': color,
+            'corner_radius': corner_radius
         }
     
     # === Glow Effects ===
@@ -159,16 +498,23 @@ class EffectsEngine:
         if not self._glow_enabled:
             return
         
-        glow_color = self._parse_color(color or self._default_glow_color)
+        glow_color = color or self._default_glow_color
         glow_intensity = intensity or self._default_glow_intensity
         
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_cached_glow(
+            painter, rect, ('glow', glow_color, glow_intensity, radius),
+            radius * 2 + 2, self._render_glow
+        )
+    
+    def _render_glow(self, painter: QPainter, rect: QRectF, color: str, intensity: float, radius: int):
+        """Stroke the stacked glow outlines for draw_glow."""
+        glow_color = self._parse_color(color)
+        
+        alphas = _glow_alphas(intensity, radius)
         
         for i in range(radius):
             glow_rect = rect.adjusted(-i*2, -i*2, i*2, i*2)
-            alpha = glow_intensity * (1.0 - i/radius) * 0.5
-            
-            glow_color.setAlphaF(max(0, alpha))
+            glow_color.setAlpha(alphas[i])
             
             path = QPainterPath()
             path.addRoundedRect(glow_rect, 8 + i, 8 + i)
@@ -177,6 +523,41 @@ class EffectsEngine:
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawPath(path)
     
+    def _draw_cached_glow(self, painter: QPainter, rect: QRectF, style: Tuple, margin: int, render):
+        """
+        Blit a glow prerendered into a transparent pixmap.
+        The layered strokes are only drawn again when style or size change.
+        """
+        dpr = painter.device().devicePixelRatioF()
+        key = style + (rect.width(), rect.height(), dpr)
+        pixmap = self._glow_pixmap_cache.get(key)
+        
+        if pixmap is not None:
+            self._glow_pixmap_cache.move_to_end(key)
+        else:
+            pixmap = QPixmap(
+                math.ceil((rect.width() + margin * 2) * dpr),
+                math.ceil((rect.height() + margin * 2) * dpr)
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(_ANTIALIASING)
+            render(pixmap_painter, QRectF(margin, margin, rect.width(), rect.height()), *style[1:])
+            pixmap_painter.end()
+            
+            self._glow_pixmap_cache[key] = pixmap
+            if len(self._glow_pixmap_cache) > _PIXMAP_CACHE_SIZE:
+                self._glow_pixmap_cache.popitem(last=False)
+        
+        # Callers may paint under a scale transform (e.g. hover zoom); filter
+        # the blit so the glow is not nearest-neighbour sampled
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(QPointF(rect.left() - margin, rect.top() - margin), pixmap)
+        painter.restore()
+    
     # === Gradient Creation ===
     
     def create_linear_gradient(
@@ -263,14 +644,11 @@ class EffectsEngine:
         if not self._transparency_enabled:
             return
         
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _ensure_antialiasing(painter)
         
-        # Background gradient
+        # Background gradient (stops are shared between equal panels)
         gradient = QLinearGradient(0, 0, 0, rect.height())
-        gradient.setColorAt(0, QColor(255, 255, 255, int(255 * opacity * 1.5)))
-        gradient.setColorAt(0.1, QColor(255, 255, 255, int(255 * opacity)))
-        gradient.setColorAt(0.5, QColor(255, 255, 255, int(255 * opacity * 0.7)))
-        gradient.setColorAt(1.0, QColor(0, 0, 0, int(255 * opacity * 0.5)))
+        gradient.setStops(_glass_gradient_stops(rect.height(), rect.top(), opacity))
         
         path = QPainterPath()
         path.addRoundedRect(rect, corner_radius, corner_radius)
@@ -279,14 +657,15 @@ class EffectsEngine:
         painter.setPen(QPen(QColor(255, 255, 255, int(255 * opacity * 2)), 1))
         painter.drawPath(path)
         
-        # Top reflection
-        painter.setPen(QPen(QColor(255, 255, 255, 40), 1))
-        painter.drawLine(
-            int(rect.left() + corner_radius),
-            int(rect.top() + 1),
-            int(rect.right() - corner_radius),
-            int(rect.top() + 1)
-        )
+        # Top reflection, when it could not be baked into the gradient
+        if not _glass_reflection_baked(rect.height(), rect.top()):
+            painter.setPen(QPen(QColor(255, 255, 255, 40), 1))
+            painter.drawLine(
+                int(rect.left() + corner_radius),
+                int(rect.top() + 1),
+                int(rect.right() - corner_radius),
+                int(rect.top() + 1)
+            )
     
     # === Bloom Effect ===
     
@@ -324,7 +703,7 @@ class EffectsEngine:
         bloom_color.setAlphaF(0)
         gradient.setColorAt(1, bloom_color)
         
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _ensure_antialiasing(painter)
         painter.setBrush(QBrush(gradient))
         painter.setPen(Qt.PenStyle.NoPen)
         
@@ -333,39 +712,25 @@ class EffectsEngine:
     # === Helper Methods ===
     
     def _parse_color(self, color_str: str) -> QColor:
-        """Parse a color string to QColor."""
-        if not color_str:
-            return QColor(255, 255, 255)
-        
-        if color_str.startswith('rgba('):
-            # Parse rgba(r, g, b, a)
-            parts = color_str.replace('rgba(', '').replace(')', '').split(',')
-            r = int(parts[0].strip())
-            g = int(parts[1].strip())
-            b = int(parts[2].strip())
-            a = float(parts[3].strip())
-            color = QColor(r, g, b)
-            color.setAlphaF(a)
-            return color
-        elif color_str.startswith('rgb('):
-            # Parse rgb(r, g, b)
-            parts = color_str.replace('rgb(', '').replace(')', '').split(',')
-            r = int(parts[0].strip())
-            g = int(parts[1].strip())
-            b = int(parts[2].strip())
-            return QColor(r, g, b)
-        else:
-            # Hex color
-            return QColor(color_str)
+        """Parse a color string to QColor (a fresh copy the caller may modify)."""
+        return QColor(_parse_color_cached(color_str))
     
     def get_contrasting_text_color(self, background: str) -> str:
         """Get appropriate text color based on background luminance."""
-        color = self._parse_color(background)
-        
-        # Calculate luminance
-        luminance = (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()) / 255
+        # Integer Rec.601 luma: 0.299r + 0.587g + 0.114b < 0.5 * 255
+        if background and len(background) == 7 and background[0] == '#':
+            try:
+                r = int(background[1:3], 16)
+                g = int(background[3:5], 16)
+                b = int(background[5:7], 16)
+            except ValueError:
+                pass
+            else:
+                return '#FFFFFF' if 299 * r + 587 * g + 114 * b < 127500 else '#1D1D1F'
         
-        return '#FFFFFF' if luminance < 0.5 else '#1D1D1F'
+        color = _parse_color_cached(background)
+        luma = 299 * color.red() + 587 * color.green() + 114 * color.blue()
+        return '#FFFFFF' if luma < 127500 else '#1D1D1F'
     
     # === New Advanced Effects ===
     
@@ -407,7 +772,7 @@ class EffectsEngine:
             blur_intensity: How much the background shows through
             corner_radius: Corner radius
         """
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _ensure_antialiasing(painter)
         
         base = self._parse_color(base_color)
         base.setAlphaF(1.0 - blur_intensity)
@@ -422,16 +787,14 @@ class EffectsEngine:
         
         # Add subtle gradient overlay for depth
         gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-        gradient.setColorAt(0, QColor(255, 255, 255, int(255 * 0.1)))
-        gradient.setColorAt(0.5, QColor(255, 255, 255, int(255 * 0.02)))
-        gradient.setColorAt(1, QColor(0, 0, 0, int(255 * 0.05)))
+        gradient.setStops(_FROSTED_GRADIENT_STOPS)
         
         painter.setBrush(QBrush(gradient))
         painter.drawPath(path)
         
         # Add edge highlight
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setPen(QPen(QColor(255, 255, 255, 30), 1))
+        painter.setPen(QPen(_FROSTED_EDGE_COLOR, 1))
         painter.drawPath(path)
     
     def draw_light_effect(
@@ -452,7 +815,7 @@ class EffectsEngine:
             direction: Direction of light ('top', 'left', 'right', 'bottom', 'center')
             intensity: Light intensity (0.0-1.0)
         """
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _ensure_antialiasing(painter)
         
         color = self._parse_color(light_color)
         
@@ -467,15 +830,11 @@ class EffectsEngine:
             color.setAlphaF(0)
             gradient.setColorAt(1, color)
         else:
-            # Directional light
-            if direction == 'top':
-                gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-            elif direction == 'bottom':
-                gradient = QLinearGradient(0, rect.bottom(), 0, rect.top())
-            elif direction == 'left':
-                gradient = QLinearGradient(rect.left(), 0, rect.right(), 0)
-            else:  # right
-                gradient = QLinearGradient(rect.right(), 0, rect.left(), 0)
+            # Directional light (unknown directions fall back to 'right')
+            fx1, fy1, fx2, fy2 = self._LIGHT_DIRS.get(direction, self._LIGHT_DIRS['right'])
+            left, top = rect.left(), rect.top()
+            w, h = rect.width(), rect.height()
+            gradient = QLinearGradient(left + fx1 * w, top + fy1 * h, left + fx2 * w, top + fy2 * h)
             
             color.setAlphaF(intensity * 0.6)
             gradient.setColorAt(0, color)
@@ -508,7 +867,7 @@ class EffectsEngine:
             stroke_color: Stroke color (None for no stroke)
             stroke_width: Width of stroke
         """
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _ensure_antialiasing(painter)
         
         if fill_color:
             painter.setBrush(QBrush(self._parse_color(fill_color)))
@@ -520,53 +879,60 @@ class EffectsEngine:
         else:
             painter.setPen(Qt.PenStyle.NoPen)
         
-        path = QPainterPath()
-        cx, cy = rect.center().x(), rect.center().y()
         w, h = rect.width(), rect.height()
+        key = (shape, w, h)
+        path = self._shape_path_cache.get(key)
+        if path is None:
+            if len(self._shape_path_cache) >= 128:
+                self._shape_path_cache.clear()
+            path = self._build_shape_path(shape, w, h)
+            self._shape_path_cache[key] = path
+        
+        painter.save()
+        painter.translate(rect.left(), rect.top())
+        painter.drawPath(path)
+        painter.restore()
+    
+    def _build_shape_path(self, shape: str, w: float, h: float) -> QPainterPath:
+        """Build a vector shape path inside (0, 0, w, h)."""
+        path = QPainterPath()
+        rect = QRectF(0, 0, w, h)
+        cx, cy = w / 2, h / 2
         
         if shape == 'circle':
             path.addEllipse(rect)
         elif shape == 'triangle':
-            path.moveTo(cx, rect.top())
-            path.lineTo(rect.right(), rect.bottom())
-            path.lineTo(rect.left(), rect.bottom())
+            path.moveTo(cx, 0)
+            path.lineTo(w, h)
+            path.lineTo(0, h)
             path.closeSubpath()
         elif shape == 'diamond':
-            path.moveTo(cx, rect.top())
-            path.lineTo(rect.right(), cy)
-            path.lineTo(cx, rect.bottom())
-            path.lineTo(rect.left(), cy)
+            path.moveTo(cx, 0)
+            path.lineTo(w, cy)
+            path.lineTo(cx, h)
+            path.lineTo(0, cy)
             path.closeSubpath()
         elif shape == 'hexagon':
-            import math
-            for i in range(6):
-                angle = math.pi / 3 * i - math.pi / 2
-                x = cx + (w / 2) * math.cos(angle)
-                y = cy + (h / 2) * math.sin(angle)
-                if i == 0:
-                    path.moveTo(x, y)
-                else:
-                    path.lineTo(x, y)
+            rx, ry = w / 2, h / 2
+            (dx, dy), *rest = _HEXAGON_VERTICES
+            path.moveTo(cx + rx * dx, cy + ry * dy)
+            for dx, dy in rest:
+                path.lineTo(cx + rx * dx, cy + ry * dy)
             path.closeSubpath()
         elif shape == 'star':
-            import math
             outer_r = min(w, h) / 2
             inner_r = outer_r * 0.4
-            for i in range(10):
-                angle = math.pi / 5 * i - math.pi / 2
-                r = outer_r if i % 2 == 0 else inner_r
-                x = cx + r * math.cos(angle)
-                y = cy + r * math.sin(angle)
-                if i == 0:
-                    path.moveTo(x, y)
-                else:
-                    path.lineTo(x, y)
+            (dx, dy), *rest = _STAR_VERTICES
+            path.moveTo(cx + outer_r * dx, cy + outer_r * dy)
+            for i, (dx, dy) in enumerate(rest, 1):
+                r = inner_r if i % 2 else outer_r
+                path.lineTo(cx + r * dx, cy + r * dy)
             path.closeSubpath()
         else:
             # Default rectangle
             path.addRoundedRect(rect, 4, 4)
         
-        painter.drawPath(path)
+        return path
     
     def draw_neon_glow(
         self,
@@ -586,17 +952,22 @@ class EffectsEngine:
             intensity: Glow intensity
             layers: Number of glow layers
         """
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+        self._draw_cached_glow(
+            painter, rect, ('neon', color, intensity, layers),
+            layers * 3 + 2, self._render_neon_glow
+        )
+    
+    def _render_neon_glow(self, painter: QPainter, rect: QRectF, color: str, intensity: float, layers: int):
+        """Stroke the outer glow layers and core outline for draw_neon_glow."""
         glow_color = self._parse_color(color)
         
+        alphas = _neon_alphas(intensity, layers)
+        
         # Draw outer glows
         for i in range(layers, 0, -1):
             expansion = i * 3
             glow_rect = rect.adjusted(-expansion, -expansion, expansion, expansion)
-            
-            alpha = (intensity * (1.0 - (i / layers)) * 0.4)
-            glow_color.setAlphaF(max(0, min(1, alpha)))
+            glow_color.setAlpha(alphas[i])
             
             path = QPainterPath()
             path.addRoundedRect(glow_rect, 8 + i * 2, 8 + i * 2)
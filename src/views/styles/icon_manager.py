@@ -4,8 +4,58 @@ Supports PNG icons (Win11 Color style from iconos8.es).
 """
 
 import os
-from PyQt6.QtGui import QIcon, QPixmap, QColor, QPainter
-from PyQt6.QtCore import Qt, QSize
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable
+from PyQt6.QtGui import QIcon, QPixmap, QColor, QImage
+from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+
+@lru_cache(maxsize=512)
+def _resolve_icon_path(icons_dir: str, icon_file: str, name: str):
+    """Resolve an icon to its PNG path, or None if missing (stats each name once)."""
+    path = os.path.join(icons_dir, f"{icon_file}.png")
+    if os.path.exists(path):
+        return path
+    
+    # Try direct name
+    path = os.path.join(icons_dir, f"{name}.png")
+    if os.path.exists(path):
+        return path
+    return None
+
+
+# Pixmap sizes stored in every shared icon; Qt scales down from the
+# nearest larger one for any other requested size
+_ICON_SIZES = (16, 24, 32, 48, 64, 96)
+
+
+class _IconPrewarmLoader(QThread):
+    """Worker thread that decodes and scales icon images off the GUI thread."""
+    icon_loaded = pyqtSignal(str, QImage, list)
+    
+    def __init__(self, jobs: list, parent=None):
+        super().__init__(parent)
+        self._jobs = jobs
+    
+    def run(self):
+        for name, path in self._jobs:
+            image = QImage(path)
+            if image.isNull():
+                continue
+            # Scale in the format QPixmap uses so results match get_icon
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            self.icon_loaded.emit(name, image, [
+                image.scaled(
+                    size, size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                for size in _ICON_SIZES
+            ])
+
 
 class IconManager:
     """
@@ -15,6 +65,9 @@ class IconManager:
     
     _instance = None
     
+    # Maximum number of icons kept in the LRU cache
+    _cache_limit = 256
+    
     # Icon name mappings for semantic access
     ICON_NAMES = {
         # Actions
@@ -103,7 +156,11 @@ class IconManager:
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
         self.icons_dir = os.path.join(self.base_dir, "media", "icons")
         self.current_color = "#FFFFFF"  # Default to white
-        self._icon_cache = {}  # Cache for loaded icons
+        self._icon_cache = OrderedDict()  # LRU cache for loaded icons
+        self._base_pixmap_cache = {}  # Full-resolution pixmaps by icon name
+        self._prewarm_loaders = []
+        self._icon_list_cache = None  # Sorted icon names from icons_dir
+        self._icon_list_mtime = 0.0
         
     @classmethod
     def get_instance(cls):
@@ -117,6 +174,33 @@ class IconManager:
         self.current_color = color
         self._icon_cache.clear()  # Clear cache when theme changes
     
+    def _resolve_path(self, name: str):
+        """Resolve an icon name to its PNG path, or None if missing."""
+        return _resolve_icon_path(self.icons_dir, _ICON_ALIASES.get(name, name), name)
+    
+    def _load_base(self, name: str) -> QPixmap:
+        """Load the full-resolution pixmap for an icon once; null if missing."""
+        pixmap = self._base_pixmap_cache.get(name)
+        if pixmap is None:
+            path = self._resolve_path(name)
+            pixmap = QPixmap(path) if path is not None else QPixmap()
+            self._base_pixmap_cache[name] = pixmap
+        return pixmap
+    
+    def _cache_get(self, cache_key: str):
+        """Get a cached icon, marking it as recently used."""
+        icon = self._icon_cache.get(cache_key)
+        if icon is not None:
+            self._icon_cache.move_to_end(cache_key)
+        return icon
+    
+    def _cache_put(self, cache_key: str, icon: QIcon):
+        """Store an icon, evicting the least recently used beyond the limit."""
+        self._icon_cache[cache_key] = icon
+        self._icon_cache.move_to_end(cache_key)
+        if len(self._icon_cache) > self._cache_limit:
+            self._icon_cache.popitem(last=False)
+    
     def get_pixmap(self, name: str, size: int = 24) -> QPixmap:
         """
         Get a pixmap for an icon (original colors preserved).
@@ -128,17 +212,7 @@ class IconManager:
         Returns:
             QPixmap scaled to the requested size
         """
-        # Resolve icon name
-        icon_file = self.ICON_NAMES.get(name, name)
-        path = os.path.join(self.icons_dir, f"{icon_file}.png")
-        
-        if not os.path.exists(path):
-            # Try direct name
-            path = os.path.join(self.icons_dir, f"{name}.png")
-            if not os.path.exists(path):
-                return QPixmap()
-        
-        pixmap = QPixmap(path)
+        pixmap = self._load_base(name)
         if pixmap.isNull():
             return QPixmap()
         
@@ -153,25 +227,68 @@ class IconManager:
         """
         Get an icon (original colors preserved - Win11 Color style).
         
+        One QIcon per name is shared across sizes; it holds pixmaps at
+        _ICON_SIZES and Qt picks the best one for the widget's icon size.
+        
         Args:
             name: Icon name (e.g. 'save', 'box', 'money')
-            size: Desired icon size
+            size: Desired icon size (the widget's iconSize decides the drawn size)
             
         Returns:
             QIcon with the colored icon
         """
-        cache_key = f"{name}_{size}"
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
+        icon = self._cache_get(name)
+        if icon is not None:
+            return icon
         
-        pixmap = self.get_pixmap(name, size)
-        if pixmap.isNull():
+        base = self._load_base(name)
+        if base.isNull():
             return QIcon()
         
-        icon = QIcon(pixmap)
-        self._icon_cache[cache_key] = icon
+        icon = QIcon()
+        for icon_size in _ICON_SIZES:
+            icon.addPixmap(base.scaled(
+                icon_size, icon_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+        self._cache_put(name, icon)
         return icon
     
+    def prewarm(self, names: Iterable[str]):
+        """
+        Load icons in the background so later get_icon calls hit the cache.
+        PNG decoding and scaling happen on a worker thread; the QPixmaps and
+        QIcon are created on the GUI thread when each icon arrives.
+        
+        Args:
+            names: Icon names to load
+        """
+        jobs = []
+        for name in names:
+            path = self._resolve_path(name)
+            if path is not None and name not in self._icon_cache:
+                jobs.append((name, path))
+        if not jobs:
+            return
+        
+        loader = _IconPrewarmLoader(jobs, QApplication.instance())
+        loader.icon_loaded.connect(self._on_prewarm_icon)
+        loader.finished.connect(lambda: self._prewarm_loaders.remove(loader))
+        loader.finished.connect(loader.deleteLater)
+        self._prewarm_loaders.append(loader)
+        loader.start()
+    
+    def _on_prewarm_icon(self, name: str, base: QImage, images: list):
+        """Finish a prewarmed icon on the GUI thread."""
+        if name not in self._base_pixmap_cache:
+            self._base_pixmap_cache[name] = QPixmap.fromImage(base)
+        if name not in self._icon_cache:
+            icon = QIcon()
+            for image in images:
+                icon.addPixmap(QPixmap.fromImage(image))
+            self._cache_put(name, icon)
+    
     def get_colored_icon(self, name: str, color: str = None, size: int = 24) -> QIcon:
         """
         Get an icon with custom color overlay (for monochrome icons).
@@ -187,8 +304,9 @@ class IconManager:
         target_color = color if color else self.current_color
         cache_key = f"{name}_{size}_{target_color}"
         
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
+        icon = self._cache_get(cache_key)
+        if icon is not None:
+            return icon
         
         pixmap = self.get_pixmap(name, size)
         if pixmap.isNull():
@@ -197,7 +315,7 @@ class IconManager:
         # Apply color overlay
         colored_pixmap = self._colorize_pixmap(pixmap, target_color)
         icon = QIcon(colored_pixmap)
-        self._icon_cache[cache_key] = icon
+        self._cache_put(cache_key, icon)
         return icon
         
     def _colorize_pixmap(self, pixmap: QPixmap, color_str: str) -> QPixmap:
@@ -205,29 +323,36 @@ class IconManager:
         if not color_str:
             return pixmap
             
-        result = QPixmap(pixmap.size())
-        result.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(result)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        
-        # Draw original
-        painter.drawPixmap(0, 0, pixmap)
-        
-        # Apply color overlay
-        painter.setCompositionMode(QPainter.CompositionMode.SourceIn)
-        painter.fillRect(result.rect(), QColor(color_str))
+        # Solid color masked by the icon's alpha (the SourceIn composite)
+        alpha = pixmap.toImage().convertToFormat(QImage.Format.Format_Alpha8)
+        result = QImage(alpha.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        result.fill(QColor(color_str))
+        result.setAlphaChannel(alpha)
         
-        painter.end()
-        
-        return result
+        return QPixmap.fromImage(result)
 
     def list_available_icons(self) -> list:
         """List all available icon names."""
-        icons = []
-        if os.path.exists(self.icons_dir):
-            for f in os.listdir(self.icons_dir):
-                if f.endswith('.png'):
-                    icons.append(f[:-4])  # Remove .png extension
-        return sorted(icons)
+        try:
+            mtime = os.stat(self.icons_dir).st_mtime
+        except OSError:
+            return []
+        
+        # Adding or removing files updates the directory mtime
+        if self._icon_list_cache is None or mtime != self._icon_list_mtime:
+            with os.scandir(self.icons_dir) as entries:
+                self._icon_list_cache = sorted(
+                    entry.name[:-4]  # Remove .png extension
+                    for entry in entries if entry.name.endswith('.png')
+                )
+            self._icon_list_mtime = mtime
+        return list(self._icon_list_cache)
+
+
+# Aliases whose file name differs from the icon name; every other name
+# resolves to a file of the same name
+_ICON_ALIASES = {
+    sys.intern(name): sys.intern(icon_file)
+    for name, icon_file in IconManager.ICON_NAMES.items()
+    if name != icon_file
+}
@@ -4,40 +4,131 @@ Supports different layout modes: panels vs menus, sidebar positions, header styl
 """
 
 import os
-from typing import Dict, Any, Optional, List, Callable
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Mapping
 from PyQt6.QtWidgets import (
     QWidget, QMainWindow, QMenuBar, QToolBar, QDockWidget,
-    QVBoxLayout, QHBoxLayout, QStackedWidget, QFrame, QSizePolicy
+    QVBoxLayout, QHBoxLayout, QStackedWidget, QFrame, QSizePolicy, QLayout,
+    QLabel, QPushButton
 )
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt6 import sip
+
+
+@contextmanager
+def _updates_suspended(widget: QWidget):
+    """
+    Suspend painting on a widget while it is restructured so Qt repaints
+    once at the end instead of after every individual change.
+    """
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if was_enabled:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+
+
+def _clear_layout(layout: QLayout):
+    """Detach every widget and nested layout from a layout."""
+    while layout.count():
+        item = layout.takeAt(0)
+        widget = item.widget()
+        if widget is not None:
+            widget.setParent(None)
+        elif item.layout() is not None:
+            _clear_layout(item.layout())
+            sip.delete(item.layout())
+
+
+# Header styles and custom structure types. Theme values are interned on
+# load, so comparisons against these hit the identity fast path.
+HEADER_MODERN = sys.intern('modern')
+HEADER_CLASSIC = sys.intern('classic')
+HEADER_MINIMAL = sys.intern('minimal')
+HEADER_HIDDEN = sys.intern('hidden')
+STRUCTURE_VERTICAL = sys.intern('vertical')
+STRUCTURE_HORIZONTAL = sys.intern('horizontal')
+
+
+def _intern(value):
+    """Intern string theme values; leave anything else untouched."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Theme JSON layout keys and their defaults
+_LAYOUT_DEFAULTS = MappingProxyType({
+    'usePanelsInsteadOfMenus': False,
+    'sidebarPosition': 'left',
+    'headerStyle': HEADER_MODERN,
+    'footerVisible': True,
+    'windowBorderless': False,
+    'contentMargins': MappingProxyType({'top': 16, 'right': 16, 'bottom': 16, 'left': 16}),
+    'sidebarWidth': 250,
+    'headerHeight': 60,
+    'footerHeight': 40,
+    'showToolbar': True,
+    'showStatusbar': True,
+    'compactMode': False,
+    'customStructure': None,
+})
 
 
 class LayoutConfig:
     """Configuration for interface layout."""
     
+    __slots__ = (
+        'use_panels_instead_of_menus', 'sidebar_position', 'header_style',
+        'footer_visible', 'window_borderless',
+        'content_margins', 'sidebar_width', 'header_height', 'footer_height',
+        'content_margins_tuple', 'sidebar_info',
+        'show_toolbar', 'show_statusbar', 'compact_mode',
+        'custom_structure',
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
-        config = config or {}
+        cfg = {**_LAYOUT_DEFAULTS, **config} if config else _LAYOUT_DEFAULTS
         
         # Layout mode
-        self.use_panels_instead_of_menus = config.get('usePanelsInsteadOfMenus', False)
-        self.sidebar_position = config.get('sidebarPosition', 'left')  # left, right, top, bottom
-        self.header_style = config.get('headerStyle', 'modern')  # modern, classic, minimal, hidden
-        self.footer_visible = config.get('footerVisible', True)
-        self.window_borderless = config.get('windowBorderless', False)
+        self.use_panels_instead_of_menus = cfg['usePanelsInsteadOfMenus']
+        self.sidebar_position = _intern(cfg['sidebarPosition'])  # left, right, top, bottom
+        self.header_style = _intern(cfg['headerStyle'])  # modern, classic, minimal, hidden
+        self.footer_visible = cfg['footerVisible']
+        self.window_borderless = cfg['windowBorderless']
         
         # Spacing and sizing
-        self.content_margins = config.get('contentMargins', {'top': 16, 'right': 16, 'bottom': 16, 'left': 16})
-        self.sidebar_width = config.get('sidebarWidth', 250)
-        self.header_height = config.get('headerHeight', 60)
-        self.footer_height = config.get('footerHeight', 40)
+        self.content_margins = cfg['contentMargins']
+        self.sidebar_width = cfg['sidebarWidth']
+        self.header_height = cfg['headerHeight']
+        self.footer_height = cfg['footerHeight']
+        
+        # Derived values handed out by LayoutEngine, computed once per config
+        m = self.content_margins
+        self.content_margins_tuple = (
+            m.get('left', 16),
+            m.get('top', 16),
+            m.get('right', 16),
+            m.get('bottom', 16)
+        )
+        self.sidebar_info = MappingProxyType({
+            'position': self.sidebar_position,
+            'width': self.sidebar_width,
+            'visible': True
+        })
         
         # Component visibility
-        self.show_toolbar = config.get('showToolbar', True)
-        self.show_statusbar = config.get('showStatusbar', True)
-        self.compact_mode = config.get('compactMode', False)
+        self.show_toolbar = cfg['showToolbar']
+        self.show_statusbar = cfg['showStatusbar']
+        self.compact_mode = cfg['compactMode']
         
         # Custom layout structure (for advanced themes)
-        self.custom_structure = config.get('customStructure', None)
+        self.custom_structure = cfg['customStructure']
 
 
 class LayoutEngine(QObject):
@@ -48,6 +139,14 @@ class LayoutEngine(QObject):
     """
     
     _instance = None
+    _instance_lock = threading.Lock()
+    
+    # Fixed menu bar height per header style (HEADER_CLASSIC uses the
+    # default, HEADER_HIDDEN hides the bar)
+    _HEADER_HEIGHTS: Dict[str, int] = {
+        HEADER_MINIMAL: 30,
+        HEADER_MODERN: 40,
+    }
     
     # Signals
     layout_changed = pyqtSignal(dict)  # Emitted when layout changes
@@ -56,29 +155,60 @@ class LayoutEngine(QObject):
     def __init__(self):
         super().__init__()
         self._current_config = LayoutConfig()
-        self._registered_windows: Dict[str, QMainWindow] = {}
+        # Weak so closed windows drop out without an explicit unregister
+        self._registered_windows: 'weakref.WeakValueDictionary[str, QMainWindow]' = (
+            weakref.WeakValueDictionary()
+        )
         self._layout_handlers: Dict[str, Callable] = {}
         self._original_layouts: Dict[str, Dict] = {}  # Store original layouts for restoration
+        
+        # Rapid configure() calls are applied to windows once, on the next
+        # event-loop tick
+        self._pending_config: Optional[Dict[str, Any]] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending)
     
     @classmethod
     def get_instance(cls) -> 'LayoutEngine':
         """Get singleton instance."""
         if cls._instance is None:
-            cls._instance = LayoutEngine()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = LayoutEngine()
         return cls._instance
     
     def configure(self, config: Dict[str, Any]):
         """
         Configure layout from theme settings.
         
+        The new config is readable right away; windows are updated and
+        layout_changed is emitted once on the next event-loop tick, so a
+        burst of calls (e.g. while editing a theme) costs a single apply.
+        
         Args:
             config: Layout configuration from theme JSON
         """
-        old_config = self._current_config
         self._current_config = LayoutConfig(config)
+        self._pending_config = config
+        self._flush_timer.start()
+    
+    def configure_immediate(self, config: Dict[str, Any]):
+        """Configure layout and apply it to windows without waiting for the event loop."""
+        self.configure(config)
+        self._flush_pending()
+    
+    def _flush_pending(self):
+        """Apply the latest pending configuration to the registered windows."""
+        self._flush_timer.stop()
+        config = self._pending_config
+        if config is None:
+            return
+        self._pending_config = None
         
         # Apply changes to registered windows
-        self._apply_layout_changes(old_config)
+        self._apply_layout_changes()
         
         # Emit signal
         self.layout_changed.emit(config)
@@ -102,6 +232,7 @@ class LayoutEngine(QObject):
         
         # Store original layout for restoration
         self._store_original_layout(window, window_id)
+        weakref.finalize(window, self._forget_window, window_id)
     
     def unregister_window(self, window_id: str):
         """Unregister a window."""
@@ -110,6 +241,12 @@ class LayoutEngine(QObject):
         if window_id in self._original_layouts:
             del self._original_layouts[window_id]
     
+    def _forget_window(self, window_id: str):
+        """Drop the saved layout of a window that has been garbage collected."""
+        # The id may have been registered again for a newer window
+        if window_id not in self._registered_windows:
+            self._original_layouts.pop(window_id, None)
+    
     def _store_original_layout(self, window: QMainWindow, window_id: str):
         """Store original window layout for potential restoration."""
         self._original_layouts[window_id] = {
@@ -118,66 +255,65 @@ class LayoutEngine(QObject):
             'statusbar_visible': window.statusBar().isVisible() if window.statusBar() else True,
         }
     
-    def _apply_layout_changes(self, old_config: LayoutConfig):
+    def _apply_layout_changes(self):
         """Apply layout changes to all registered windows."""
-        for window_id, window in self._registered_windows.items():
+        for window_id, window in list(self._registered_windows.items()):
             try:
-                self._apply_window_layout(window, old_config)
+                self._apply_window_layout(window)
             except Exception as e:
                 print(f"Error applying layout to {window_id}: {e}")
     
-    def _apply_window_layout(self, window: QMainWindow, old_config: LayoutConfig):
-        """Apply layout configuration to a window."""
+    def _apply_window_layout(self, window: QMainWindow):
+        """
+        Apply layout configuration to a window. Each setting is compared with
+        the window's actual state, so re-applying an unchanged layout touches
+        nothing while a window changed elsewhere (e.g. restored) is corrected.
+        """
         config = self._current_config
+        menu_bar = window.menuBar()
+        status_bar = window.statusBar()
         
-        # Handle borderless mode
-        if config.window_borderless:
-            window.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        
-        # Handle menu bar visibility (panels vs menus)
-        if window.menuBar():
-            if config.use_panels_instead_of_menus:
-                window.menuBar().hide()
-            else:
-                window.menuBar().show()
+        # The 'hidden' header style hides the menu bar just like panels do
+        make_frameless = (
+            config.window_borderless
+            and not window.windowFlags() & Qt.WindowType.FramelessWindowHint
+        )
+        menu_hidden = config.use_panels_instead_of_menus or config.header_style == HEADER_HIDDEN
+        header_height = self._HEADER_HEIGHTS.get(config.header_style)
+        fix_menu_visibility = menu_bar is not None and menu_bar.isHidden() != menu_hidden
+        fix_menu_height = (
+            menu_bar is not None and header_height is not None
+            and not (menu_bar.minimumHeight() == header_height == menu_bar.maximumHeight())
+        )
+        fix_statusbar = status_bar is not None and status_bar.isHidden() == config.show_statusbar
         
-        # Handle status bar
-        if window.statusBar():
-            window.statusBar().setVisible(config.show_statusbar)
+        if not (make_frameless or fix_menu_visibility or fix_menu_height or fix_statusbar):
+            return
         
-        # Apply header style
-        self._apply_header_style(window, config.header_style)
-    
-    def _apply_header_style(self, window: QMainWindow, style: str):
-        """Apply header style to window."""
-        if style == 'hidden':
-            if window.menuBar():
-                window.menuBar().hide()
-        elif style == 'minimal':
-            if window.menuBar():
-                window.menuBar().setFixedHeight(30)
-        elif style == 'modern':
-            if window.menuBar():
-                window.menuBar().setFixedHeight(40)
-        # 'classic' uses default
+        with _updates_suspended(window):
+            # Handle borderless mode
+            if make_frameless:
+                window.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+            
+            # Handle menu bar visibility (panels vs menus, hidden header)
+            if fix_menu_visibility:
+                menu_bar.setHidden(menu_hidden)
+            
+            # Apply header style
+            if fix_menu_height:
+                menu_bar.setFixedHeight(header_height)
+            
+            # Handle status bar
+            if fix_statusbar:
+                status_bar.setVisible(config.show_statusbar)
     
     def get_content_margins(self) -> tuple:
         """Get current content margins as (left, top, right, bottom)."""
-        m = self._current_config.content_margins
-        return (
-            m.get('left', 16),
-            m.get('top', 16),
-            m.get('right', 16),
-            m.get('bottom', 16)
-        )
+        return self._current_config.content_margins_tuple
     
-    def get_sidebar_info(self) -> Dict[str, Any]:
-        """Get sidebar configuration."""
-        return {
-            'position': self._current_config.sidebar_position,
-            'width': self._current_config.sidebar_width,
-            'visible': True
-        }
+    def get_sidebar_info(self) -> Mapping[str, Any]:
+        """Get sidebar configuration (read-only)."""
+        return self._current_config.sidebar_info
     
     def should_use_panels(self) -> bool:
         """Check if panels should be used instead of menus."""
@@ -210,12 +346,10 @@ class LayoutEngine(QObject):
             return
         
         # Get structure type
-        struct_type = structure.get('type', 'vertical')
+        struct_type = structure.get('type', STRUCTURE_VERTICAL)
         
-        # Create appropriate layout
-        if struct_type == 'vertical':
-            layout = QVBoxLayout()
-        elif struct_type == 'horizontal':
+        # Create appropriate layout (vertical unless horizontal is requested)
+        if struct_type == STRUCTURE_HORIZONTAL:
             layout = QHBoxLayout()
         else:
             layout = QVBoxLayout()
@@ -233,10 +367,13 @@ class LayoutEngine(QObject):
         )
         
         # Set layout to target
-        if target.layout():
-            # Clear existing layout
-            QWidget().setLayout(target.layout())
-        target.setLayout(layout)
+        with _updates_suspended(target):
+            old_layout = target.layout()
+            if old_layout is not None:
+                # Clear and delete the existing layout so the new one can be set
+                _clear_layout(old_layout)
+                sip.delete(old_layout)
+            target.setLayout(layout)
     
     def create_panel_from_menu(self, menu_data: Dict[str, Any]) -> QFrame:
         """
@@ -249,8 +386,6 @@ class LayoutEngine(QObject):
         Returns:
             QFrame panel widget
         """
-        from PyQt6.QtWidgets import QLabel, QPushButton
-        
         panel = QFrame()
         panel.setObjectName("menu_panel")
         layout = QVBoxLayout(panel)
@@ -283,25 +418,29 @@ class LayoutEngine(QObject):
         Args:
             window_id: Specific window to restore, or None for all
         """
+        # Settle any pending configure first so it cannot land afterwards
+        self._flush_pending()
+        
         if window_id:
             if window_id in self._original_layouts:
                 window = self._registered_windows.get(window_id)
                 if window:
                     self._restore_window_layout(window, self._original_layouts[window_id])
         else:
-            for wid, window in self._registered_windows.items():
+            for wid, window in list(self._registered_windows.items()):
                 if wid in self._original_layouts:
                     self._restore_window_layout(window, self._original_layouts[wid])
     
     def _restore_window_layout(self, window: QMainWindow, original: Dict):
         """Restore a window to its original layout."""
-        if window.menuBar():
-            window.menuBar().setVisible(original.get('menubar_visible', True))
-        if window.statusBar():
-            window.statusBar().setVisible(original.get('statusbar_visible', True))
-        
-        # Remove borderless flag
-        window.setWindowFlags(Qt.WindowType.Window)
+        with _updates_suspended(window):
+            if window.menuBar():
+                window.menuBar().setVisible(original.get('menubar_visible', True))
+            if window.statusBar():
+                window.statusBar().setVisible(original.get('statusbar_visible', True))
+            
+            # Remove borderless flag
+            window.setWindowFlags(Qt.WindowType.Window)
 
 
 # Global instance accessor
@@ -5,10 +5,52 @@ Official themes use Windows system sounds, custom themes can use custom audio fi
 
 import os
 import platform
-from typing import Dict, Optional
-from PyQt6.QtCore import QUrl
+import sys
+import threading
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6.QtCore import QUrl, QThread, QTimer, QCoreApplication, pyqtSignal
 from PyQt6.QtMultimedia import QSoundEffect, QMediaPlayer, QAudioOutput
 
+# winsound only exists on Windows; import it once instead of per sound event
+try:
+    import winsound
+    WINSOUND_AVAILABLE = True
+except ImportError:
+    WINSOUND_AVAILABLE = False
+
+# System sounds played through MessageBeep; other names use PlaySound
+_MESSAGE_BEEPS = {
+    'SystemDefault': 'MB_OK',
+    'SystemExclamation': 'MB_ICONEXCLAMATION',
+    'SystemHand': 'MB_ICONHAND',
+    'SystemAsterisk': 'MB_ICONASTERISK',
+}
+
+
+@lru_cache(maxsize=64)
+def _sound_url(path: str) -> QUrl:
+    """File URL for a sound path; themes often share the same files."""
+    return QUrl.fromLocalFile(path)
+
+
+class _SoundFileChecker(QThread):
+    """Worker thread that checks which theme sound files exist on disk."""
+    files_checked = pyqtSignal(int, list)
+    
+    def __init__(self, generation: int, candidates: List[Tuple[str, str]], parent=None):
+        super().__init__(parent)
+        self._generation = generation
+        self._candidates = candidates
+    
+    def run(self):
+        found = [(name, path) for name, path in self._candidates if os.path.exists(path)]
+        self.files_checked.emit(self._generation, found)
+
+
+def _play_disabled(sound_name: str):
+    """Stand-in for SoundManager.play while sounds are disabled."""
+
 
 class SoundManager:
     """
@@ -19,6 +61,10 @@ class SoundManager:
     """
     
     _instance = None
+    _instance_lock = threading.Lock()
+    
+    # Sound event -> ready-to-call winsound player, built on first use
+    _system_dispatch: Optional[Dict[str, Callable[[], None]]] = None
     
     # Windows system sounds mapping
     WINDOWS_SOUNDS = {
@@ -49,17 +95,31 @@ class SoundManager:
         self._sounds: Dict[str, QSoundEffect] = {}
         self._music_player: Optional[QMediaPlayer] = None
         self._audio_output: Optional[QAudioOutput] = None
+        # Source currently loaded in the music player, if any
+        self._current_music_path: Optional[str] = None
         self._enabled = True
         self._volume = 0.5
         self._use_system_sounds = True
         self._custom_sounds_path: Optional[str] = None
         self._is_windows = platform.system() == 'Windows'
+        # Bumped on every reconfigure so late file checks for an old theme are ignored
+        self._load_generation = 0
+        self._file_checkers: List[_SoundFileChecker] = []
+        self._update_play()
+        
+        # Volume slider ticks are pushed to the players at most once per frame
+        self._volume_timer = QTimer()
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(16)
+        self._volume_timer.timeout.connect(self._apply_volume)
     
     @classmethod
     def get_instance(cls) -> 'SoundManager':
         """Get singleton instance."""
         if cls._instance is None:
-            cls._instance = SoundManager()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = SoundManager()
         return cls._instance
     
     @property
@@ -69,26 +129,45 @@ class SoundManager:
     @enabled.setter
     def enabled(self, value: bool):
         self._enabled = value
+        self._update_play()
         if not value and self._music_player:
             self._music_player.stop()
     
+    @property
+    def current_music_path(self) -> Optional[str]:
+        """Music file loaded in the player, or None when nothing is loaded."""
+        return self._current_music_path
+    
     @property
     def volume(self) -> float:
         return self._volume
     
     @volume.setter
     def volume(self, value: float):
-        self._volume = max(0.0, min(1.0, value))
+        value = max(0.0, min(1.0, value))
+        if value == self._volume:
+            return
+        self._volume = value
+        if QCoreApplication.instance() is None:
+            self._apply_volume()
+        elif not self._volume_timer.isActive():
+            self._volume_timer.start()
+    
+    def _apply_volume(self):
+        """Push the current volume to the loaded sounds and the music output."""
+        volume = self._volume
         for sound in self._sounds.values():
-            sound.setVolume(self._volume)
+            sound.setVolume(volume)
         if self._audio_output:
-            self._audio_output.setVolume(self._volume)
+            self._audio_output.setVolume(volume)
     
     def configure_for_official_theme(self):
         """Configure to use Windows system sounds (for official themes)."""
         self._use_system_sounds = True
+        self._update_play()
         self._custom_sounds_path = None
         self._sounds.clear()
+        self._load_generation += 1
     
     def configure_for_custom_theme(self, theme_path: str, sound_config: Dict):
         """
@@ -99,6 +178,7 @@ class SoundManager:
             sound_config: Sound configuration from theme JSON
         """
         self._use_system_sounds = False
+        self._update_play()
         self._custom_sounds_path = theme_path
         self._sounds.clear()
         
@@ -110,19 +190,45 @@ class SoundManager:
         if 'enabled' in sound_config:
             self.enabled = sound_config['enabled']
         
-        # Load custom sound effects
+        # Load custom sound effects. The files are checked on a worker
+        # thread; the QSoundEffects are created on the GUI thread once the
+        # check comes back.
         effects = sound_config.get('effects', {})
-        for event_name, relative_path in effects.items():
-            if relative_path:
-                full_path = os.path.join(theme_path, relative_path)
-                if os.path.exists(full_path):
-                    self._load_sound(event_name, full_path)
+        candidates = [
+            (sys.intern(event_name), os.path.join(theme_path, relative_path))
+            for event_name, relative_path in effects.items() if relative_path
+        ]
+        self._load_generation += 1
+        if not candidates:
+            return
+        
+        app = QCoreApplication.instance()
+        if app is None:
+            self._on_sound_files_checked(
+                self._load_generation,
+                [(name, path) for name, path in candidates if os.path.exists(path)]
+            )
+            return
+        
+        checker = _SoundFileChecker(self._load_generation, candidates, app)
+        checker.files_checked.connect(self._on_sound_files_checked)
+        checker.finished.connect(lambda: self._file_checkers.remove(checker))
+        checker.finished.connect(checker.deleteLater)
+        self._file_checkers.append(checker)
+        checker.start()
+    
+    def _on_sound_files_checked(self, generation: int, found: list):
+        """Create the sound effects for the files that exist (GUI thread)."""
+        if generation != self._load_generation:
+            return
+        for event_name, full_path in found:
+            self._load_sound(event_name, full_path)
     
     def _load_sound(self, name: str, path: str):
         """Load a sound effect from file."""
         try:
             sound = QSoundEffect()
-            sound.setSource(QUrl.fromLocalFile(path))
+            sound.setSource(_sound_url(path))
             sound.setVolume(self._volume)
             sound.setLoopCount(1)
             self._sounds[name] = sound
@@ -144,33 +250,49 @@ class SoundManager:
         else:
             self._play_custom_sound(sound_name)
     
+    def _update_play(self):
+        """
+        Bind self.play straight to the player for the current mode, or to a
+        no-op while disabled, so hover/click sounds skip the mode checks.
+        """
+        if not self._enabled:
+            self.play = _play_disabled
+        elif self._use_system_sounds:
+            self.play = self._play_system_sound
+        else:
+            self.play = self._play_custom_sound
+    
     def _play_system_sound(self, sound_name: str):
         """Play a Windows system sound."""
-        if not self._is_windows:
-            return
+        dispatch = SoundManager._system_dispatch
+        if dispatch is None:
+            dispatch = SoundManager._system_dispatch = self._build_system_dispatch()
         
-        try:
-            import winsound
-            
-            # Map sound name to Windows sound
-            system_sound = self.WINDOWS_SOUNDS.get(sound_name)
-            
-            if system_sound == 'SystemDefault':
-                winsound.MessageBeep(winsound.MB_OK)
-            elif system_sound == 'SystemExclamation':
-                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-            elif system_sound == 'SystemHand':
-                winsound.MessageBeep(winsound.MB_ICONHAND)
-            elif system_sound == 'SystemAsterisk':
-                winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            elif system_sound:
-                # Try to play named system sound
-                try:
-                    winsound.PlaySound(system_sound, winsound.SND_ALIAS | winsound.SND_ASYNC)
-                except:
-                    pass
-        except ImportError:
-            pass  # winsound not available
+        play = dispatch.get(sound_name)
+        if play is not None:
+            try:
+                play()
+            except:
+                pass
+    
+    @classmethod
+    def _build_system_dispatch(cls) -> Dict[str, Callable[[], None]]:
+        """Map each sound event straight to the winsound call that plays it."""
+        if not WINSOUND_AVAILABLE:
+            return {}
+        
+        dispatch = {}
+        for sound_name, system_sound in cls.WINDOWS_SOUNDS.items():
+            if not system_sound:
+                continue
+            beep = _MESSAGE_BEEPS.get(system_sound)
+            if beep is not None:
+                dispatch[sound_name] = partial(winsound.MessageBeep, getattr(winsound, beep))
+            else:
+                dispatch[sound_name] = partial(
+                    winsound.PlaySound, system_sound, winsound.SND_ALIAS | winsound.SND_ASYNC
+                )
+        return dispatch
     
     def _play_custom_sound(self, sound_name: str):
         """Play a custom theme sound."""
@@ -200,7 +322,11 @@ class SoundManager:
             
             self._audio_output.setVolume(self._volume * 0.5)  # Music at half volume
             
-            self._music_player.setSource(QUrl.fromLocalFile(file_path))
+            # Reopening the same file would restart the backend for nothing;
+            # play() just resumes it if it was stopped or paused
+            if file_path != self._current_music_path:
+                self._music_player.setSource(QUrl.fromLocalFile(file_path))
+                self._current_music_path = file_path
             
             if loop:
                 self._music_player.setLoops(QMediaPlayer.Loops.Infinite)
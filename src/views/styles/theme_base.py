@@ -3,70 +3,94 @@ Theme Base Module - Core theme configuration and utilities.
 Provides enhanced theme support with transparency, animations, and glow effects.
 """
 
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 from PyQt6.QtGui import QColor
 
 
-def get_luminance(color: str) -> float:
-    """Calculate luminance of a color to determine if it's light or dark."""
-    if color.startswith('rgba'):
-        # Extract RGB from rgba
-        parts = color.replace('rgba(', '').replace(')', '').split(',')
-        r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
-    elif color.startswith('#'):
-        hex_color = color.lstrip('#')
+_RGBA_RE = re.compile(r'rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)')
+_HEX_RE = re.compile(r'#([0-9a-fA-F]{6}|[0-9a-fA-F]{3})')
+
+
+@lru_cache(maxsize=256)
+def _parse_color(color: str) -> Optional[Tuple[int, int, int, float]]:
+    """Parse '#RGB', '#RRGGBB' or 'rgb(a)(...)' into (r, g, b, alpha), or None."""
+    match = _RGBA_RE.match(color)
+    if match:
+        r, g, b, a = match.groups()
+        return int(r), int(g), int(b), float(a) if a else 1.0
+    
+    match = _HEX_RE.match(color)
+    if match:
+        hex_color = match.group(1)
         if len(hex_color) == 3:
             hex_color = ''.join([c*2 for c in hex_color])
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-    else:
+        return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16), 1.0
+    
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_luminance(color: str) -> float:
+    """Calculate luminance of a color to determine if it's light or dark."""
+    parsed = _parse_color(color)
+    if parsed is None:
         return 0.5  # Default middle
     
     # Calculate relative luminance
+    r, g, b, _ = parsed
     return (0.299 * r + 0.587 * g + 0.114 * b) / 255
 
 
+# Text colors filled in by ensure_contrast, keyed by "is dark"
+_CONTRAST_TEXT = {
+    True: MappingProxyType({
+        'text_primary': '#FFFFFF',
+        'text_secondary': 'rgba(255, 255, 255, 0.7)',
+    }),
+    False: MappingProxyType({
+        'text_primary': '#1D1D1F',
+        'text_secondary': 'rgba(0, 0, 0, 0.6)',
+    }),
+}
+
+
 def is_dark_theme(config: Dict[str, Any]) -> bool:
     """Determine if a theme is dark based on background color."""
-    bg = config.get('background', '#121212')
-    if config.get('is_dark') is not None:
-        return config.get('is_dark')
-    return get_luminance(bg) < 0.5
+    is_dark = config.get('is_dark')
+    if is_dark is not None:
+        return is_dark
+    return get_luminance(config.get('background', '#121212')) < 0.5
 
 
 def get_contrast_color(config: Dict[str, Any]) -> str:
     """Get contrasting text color based on theme brightness."""
-    if is_dark_theme(config):
-        return config.get('text_primary', '#FFFFFF')
-    else:
-        return config.get('text_primary', '#1D1D1F')
+    return config.get('text_primary', _CONTRAST_TEXT[bool(is_dark_theme(config))]['text_primary'])
 
 
 def ensure_contrast(config: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure text colors have proper contrast with backgrounds."""
-    enhanced = config.copy()
-    
-    # Auto-set text color if not specified correctly
-    if is_dark_theme(config):
-        if 'text_primary' not in config:
-            enhanced['text_primary'] = '#FFFFFF'
-        if 'text_secondary' not in config:
-            enhanced['text_secondary'] = 'rgba(255, 255, 255, 0.7)'
-    else:
-        if 'text_primary' not in config:
-            enhanced['text_primary'] = '#1D1D1F'
-        if 'text_secondary' not in config:
-            enhanced['text_secondary'] = 'rgba(0, 0, 0, 0.6)'
-    
-    return enhanced
+    return _with_contrast(config, is_dark_theme(config))
+
+
+def _with_contrast(config: Dict[str, Any], is_dark: bool) -> Dict[str, Any]:
+    """ensure_contrast for a theme whose darkness is already known."""
+    # Auto-set text colors the theme does not specify
+    return {**_CONTRAST_TEXT[bool(is_dark)], **config}
 
 
 class ThemeConfig:
     """Enhanced theme configuration with advanced effects support."""
     
-    # Default values for all theme properties
-    DEFAULTS = {
+    __slots__ = (
+        '_is_dark', '_merged', '_qcolor_cache',
+        '_has_transparency', '_has_glow', '_has_animations', '_animation_duration',
+    )
+    
+    # Default values for all theme properties (read-only)
+    DEFAULTS = MappingProxyType({
         # Base colors
         'background': '#1C1C1E',
         'background_solid': '#1C1C1E',
@@ -138,19 +162,28 @@ class ThemeConfig:
         
         # Scrollbar
         'scrollbar': '#48484A',
-    }
+    })
     
     def __init__(self, config: Dict[str, Any]):
-        self._config = ensure_contrast(config)
-        self._is_dark = is_dark_theme(self._config)
+        # The contrast colors never change 'background' or 'is_dark', so the
+        # theme's darkness is computed once and reused for both
+        self._is_dark = is_dark_theme(config)
+        # Defaults are merged once so lookups are a single dict access
+        self._merged = {**self.DEFAULTS, **_with_contrast(config, self._is_dark)}
+        self._qcolor_cache: Dict[str, QColor] = {}
+        
+        # The config never changes after construction, so the derived flags
+        # read by stylesheet builders are computed once
+        get = self._merged.get
+        self._has_transparency = get('transparency', 0) > 0 or get('glassmorphism', False)
+        self._has_glow = get('glow_enabled', False)
+        speed = get('animation_speed', 1.0)
+        self._has_animations = speed > 0
+        self._animation_duration = int(200 / max(speed, 0.1))
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value with fallback to defaults."""
-        if key in self._config:
-            return self._config[key]
-        if key in self.DEFAULTS:
-            return self.DEFAULTS[key]
-        return default
+        return self._merged.get(key, default)
     
     @property
     def is_dark(self) -> bool:
@@ -158,39 +191,44 @@ class ThemeConfig:
     
     @property
     def has_transparency(self) -> bool:
-        return self.get('transparency', 0) > 0 or self.get('glassmorphism', False)
+        return self._has_transparency
     
     @property
     def has_glow(self) -> bool:
-        return self.get('glow_enabled', False)
+        return self._has_glow
     
     @property
     def has_animations(self) -> bool:
-        return self.get('animation_speed', 1.0) > 0
+        return self._has_animations
     
     @property
     def animation_duration(self) -> int:
         """Get animation duration in ms, scaled by animation_speed."""
-        base_duration = 200
-        speed = self.get('animation_speed', 1.0)
-        return int(base_duration / max(speed, 0.1))
+        return self._animation_duration
     
     def get_qcolor(self, key: str) -> QColor:
-        """Get a config value as QColor."""
-        color_str = self.get(key, '#FFFFFF')
-        if color_str.startswith('rgba'):
-            # Parse rgba(r, g, b, a)
-            parts = color_str.replace('rgba(', '').replace(')', '').split(',')
-            r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
-            a = float(parts[3].strip()) if len(parts) > 3 else 1.0
-            color = QColor(r, g, b)
-            color.setAlphaF(a)
-            return color
-        else:
-            return QColor(color_str)
+        """
+        Get a config value as QColor.
+        Parsed colors are cached per key; callers get a copy because they
+        commonly adjust the alpha before painting.
+        """
+        color = self._qcolor_cache.get(key)
+        if color is None:
+            color = self._qcolor_cache[key] = self._build_qcolor(self.get(key, '#FFFFFF'))
+        return QColor(color)
+    
+    @staticmethod
+    def _build_qcolor(color_str: str) -> QColor:
+        """Build a QColor from a hex, named or rgb(a) color string."""
+        if color_str.startswith('rgb'):
+            parsed = _parse_color(color_str)
+            if parsed is not None:
+                r, g, b, a = parsed
+                color = QColor(r, g, b)
+                color.setAlphaF(a)
+                return color
+        return QColor(color_str)
     
     def to_dict(self) -> Dict[str, Any]:
         """Get full config as dict with defaults applied."""
-        result = self.DEFAULTS.copy()
-        result.update(self._config)
-        return result
+        return dict(self._merged)
@@ -4,11 +4,22 @@ Handles theme loading, application, and management of animations, sounds, effect
 """
 
 import os
+import re
 import sys
 import json
-from typing import Dict, Any, Optional, List
-from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtGui import QIcon
+import inspect
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple
+from PyQt6.QtWidgets import QWidget, QApplication, QStyleOption
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QIcon, QIconEngine, QPixmap, QPixmapCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .animation_engine import AnimationEngine, get_animation_engine
 from .sound_manager import SoundManager, get_sound_manager
@@ -30,414 +41,172 @@ THEMES_DIR = os.path.join(BASE_DIR, "media", "themes")
 CUSTOM_THEMES_DIR = os.path.join(THEMES_DIR, "custom")
 ICONS_DIR = os.path.join(BASE_DIR, "media", "icons")
 
+# Scaling modes for custom icon overrides
+_KEEP_ASPECT = Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH = Qt.TransformationMode.SmoothTransformation
 
-class ThemeData:
-    """Represents a loaded theme with all its configuration."""
-    
-    def __init__(self, name: str, config: Dict[str, Any], path: str = None, is_official: bool = True):
-        self.name = name
-        self.config = config
-        self.path = path  # Base path for custom theme assets
-        self.is_official = is_official
-        
-        # Extract major sections
-        self.colors = config.get('colors', {})
-        self.effects = config.get('effects', {})
-        self.typography = config.get('typography', {})
-        self.animations = config.get('animations', {})
-        self.sounds = config.get('sounds', {})
-        self.layout = config.get('layout', {})
-        self.components = config.get('components', {})
-        self.assets = config.get('assets', {})
-        self.icons = config.get('icons', {})  # Custom icon mappings
-    
-    def get_color(self, path: str, default: str = '#FFFFFF') -> str:
-        """
-        Get a color by path (e.g., 'background.primary', 'accent.glow').
-        
-        Args:
-            path: Dot-separated path to color
-            default: Default value if not found
-        """
-        parts = path.split('.')
-        value = self.colors
-        
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return default
-        
-        return value if isinstance(value, str) else default
-    
-    def get_component_config(self, component_type: str) -> Dict[str, Any]:
-        """Get configuration for a specific component type."""
-        return self.components.get(component_type, {})
-    
-    def get_animation_config(self, component_type: str) -> Dict[str, Any]:
-        """Get animation config for a component type."""
-        return self.animations.get('components', {}).get(component_type, {})
+# Shared decoder for the stdlib fallback; decode() skips json.loads' dispatch
+_JSON_DECODER = json.JSONDecoder()
 
+# A theme file whose first key is "name"; lets discovery skip the full parse
+_LEADING_NAME_RE = re.compile(r'\s*\{\s*"name"\s*:\s*("(?:[^"\\]|\\.)*")')
 
-class ThemeIconManager:
+
+def _read_theme_name(filepath: str) -> Optional[str]:
     """
-    Manages icon loading with custom theme icon override support.
-    Wraps IconManager and provides custom icon substitution for custom themes.
+    Read a theme's name from the start of its JSON file.
+    Returns None when "name" is not the leading key, so the caller has to
+    parse the whole file instead.
     """
-    
-    def __init__(self, base_icon_manager: IconManager):
-        self._base_manager = base_icon_manager
-        self._custom_icons: Dict[str, str] = {}  # name -> custom path
-        self._custom_theme_path: Optional[str] = None
-    
-    def configure_for_official(self):
-        """Use only base icons (for official themes)."""
-        self._custom_icons.clear()
-        self._custom_theme_path = None
-        self._base_manager._icon_cache.clear()
-    
-    def configure_for_custom(self, theme_path: str, icon_config: Dict[str, str]):
-        """
-        Configure custom icon mappings.
-        
-        Args:
-            theme_path: Base path to custom theme
-            icon_config: Mapping of icon names to relative paths
-        """
-        self._custom_theme_path = theme_path
-        self._custom_icons = icon_config or {}
-        self._base_manager._icon_cache.clear()
-    
-    def get_icon(self, name: str, size: int = 24) -> QIcon:
-        """Get icon by name, checking custom icons first."""
-        # Check for custom icon override
-        if name in self._custom_icons and self._custom_theme_path:
-            custom_path = os.path.join(self._custom_theme_path, self._custom_icons[name])
-            if os.path.exists(custom_path):
-                from PyQt6.QtGui import QPixmap
-                pixmap = QPixmap(custom_path)
-                if not pixmap.isNull():
-                    from PyQt6.QtCore import Qt
-                    scaled = pixmap.scaled(
-                        size, size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    return QIcon(scaled)
-        
-        # Fall back to base icon manager
-        return self._base_manager.get_icon(name, size)
-    
-    def get_pixmap(self, name: str, size: int = 24):
-        """Get pixmap by name, checking custom icons first."""
-        if name in self._custom_icons and self._custom_theme_path:
-            custom_path = os.path.join(self._custom_theme_path, self._custom_icons[name])
-            if os.path.exists(custom_path):
-                from PyQt6.QtGui import QPixmap
-                from PyQt6.QtCore import Qt
-                pixmap = QPixmap(custom_path)
-                if not pixmap.isNull():
-                    return pixmap.scaled(
-                        size, size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-        
-        return self._base_manager.get_pixmap(name, size)
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            head = f.read(1024)
+        match = _LEADING_NAME_RE.match(head)
+        return _JSON_DECODER.decode(match.group(1)) if match else None
+    except (OSError, ValueError):
+        return None
 
 
-class ThemeEngine:
+@contextmanager
+def _top_level_updates_suspended():
     """
-    Central theme engine orchestrating all subsystems.
-    
-    Manages:
-    - Theme loading and switching
-    - Animation engine configuration
-    - Sound manager configuration  
-    - Effects engine configuration
-    - Icon management with custom overrides
-    - Component registry updates
+    Suspend painting on every visible top-level window so a theme switch
+    that touches many widgets repaints once at the end.
     """
+    app = QApplication.instance()
+    windows = [
+        w for w in (app.topLevelWidgets() if app else ())
+        if w.isVisible() and w.updatesEnabled()
+    ]
+    for window in windows:
+        window.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for window in windows:
+            window.setUpdatesEnabled(True)
+            window.update()
+
+
+def _callback_key(callback: callable):
+    """
+    Registry key for a callback. Bound methods are held through WeakMethod so
+    their owner (typically a widget) can still be collected; any other
+    callable (functions, lambdas, partials) is held strongly, since an inline
+    one has no other owner.
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return callback
+
+
+def _safe_callback(callback_key) -> callable:
+    """
+    Wrap a theme change callback so its errors are reported, not raised.
+    The wrapper returns False once a weakly held method's owner is gone.
+    """
+    if isinstance(callback_key, weakref.WeakMethod):
+        resolve = callback_key
+    else:
+        resolve = lambda: callback_key
     
-    _instance = None
-    
-    def __init__(self):
-        # Subsystems
-        self.animation_engine = get_animation_engine()
-        self.sound_manager = get_sound_manager()
-        self.effects_engine = get_effects_engine()
-        self.layout_engine = get_layout_engine()
-        self.component_registry = get_component_registry()
-        
-        # Icon management
-        self._base_icon_manager = IconManager.get_instance()
-        self.icon_manager = ThemeIconManager(self._base_icon_manager)
-        
-        # Current theme
-        self.current_theme: Optional[ThemeData] = None
-        self._available_themes: Dict[str, ThemeData] = {}
-        
-        # Theme change callbacks
-        self._theme_change_callbacks: List[callable] = []
-        
-        # Load available themes
-        self._discover_themes()
-    
-    @classmethod
-    def get_instance(cls) -> 'ThemeEngine':
-        """Get singleton instance."""
-        if cls._instance is None:
-            cls._instance = ThemeEngine()
-        return cls._instance
-    
-    def _discover_themes(self):
-        """Discover all available themes."""
-        self._available_themes.clear()
-        
-        # Load official themes from themes directory
-        if os.path.exists(THEMES_DIR):
-            for filename in os.listdir(THEMES_DIR):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(THEMES_DIR, filename)
-                    theme = self._load_theme_file(filepath, is_official=True)
-                    if theme:
-                        self._available_themes[theme.name] = theme
-        
-        # Load custom themes
-        if os.path.exists(CUSTOM_THEMES_DIR):
-            for theme_name in os.listdir(CUSTOM_THEMES_DIR):
-                theme_dir = os.path.join(CUSTOM_THEMES_DIR, theme_name)
-                if os.path.isdir(theme_dir):
-                    # Look for theme JSON
-                    json_path = os.path.join(theme_dir, f"{theme_name}.json")
-                    if os.path.exists(json_path):
-                        theme = self._load_theme_file(json_path, is_official=False, base_path=theme_dir)
-                        if theme:
-                            self._available_themes[theme.name] = theme
-    
-    def _load_theme_file(self, filepath: str, is_official: bool = True, base_path: str = None) -> Optional[ThemeData]:
-        """Load a theme from JSON file."""
+    def safe_callback(theme) -> bool:
+        callback = resolve()
+        if callback is None:
+            return False
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            name = data.get('name', os.path.splitext(os.path.basename(filepath))[0])
-            return ThemeData(
-                name=name,
-                config=data,
-                path=base_path or os.path.dirname(filepath),
-                is_official=is_official
-            )
+            callback(theme)
         except Exception as e:
-            print(f"Error loading theme from {filepath}: {e}")
-            return None
-    
-    def get_available_themes(self) -> List[str]:
-        """Get list of available theme names."""
-        return list(self._available_themes.keys())
-    
-    def get_theme(self, name: str) -> Optional[ThemeData]:
-        """Get a theme by name."""
-        return self._available_themes.get(name)
-    
-    def load_theme(self, theme_name: str) -> bool:
-        """
-        Load and apply a theme.
-        
-        Args:
-            theme_name: Name of theme to load
-        
-        Returns:
-            True if successful
-        """
-        theme = self._available_themes.get(theme_name)
-        if not theme:
-            print(f"Theme '{theme_name}' not found")
-            return False
-        
-        self.current_theme = theme
-        
-        # Configure subsystems
-        self._configure_animations(theme)
-        self._configure_sounds(theme)
-        self._configure_effects(theme)
-        self._configure_icons(theme)
-        self._configure_layout(theme)
-        
-        # Update all registered components
-        self.component_registry.apply_theme_to_all(theme.config)
-        
-        # Notify callbacks
-        self._notify_theme_change(theme)
-        
+            print(f"Error in theme change callback: {e}")
         return True
-    
-    def _configure_animations(self, theme: ThemeData):
-        """Configure animation engine for theme."""
-        anim_config = theme.animations
-        
-        # Set global speed
-        global_speed = anim_config.get('globalSpeed', 1.0)
-        self.animation_engine.set_global_speed(global_speed)
-        
-        # Set component overrides
-        component_anims = anim_config.get('components', {})
-        self.animation_engine.set_custom_overrides(component_anims)
-    
-    def _configure_sounds(self, theme: ThemeData):
-        """Configure sound manager for theme."""
-        if theme.is_official:
-            # Official themes use Windows system sounds
-            self.sound_manager.configure_for_official_theme()
-        else:
-            # Custom themes can have custom sounds
-            self.sound_manager.configure_for_custom_theme(
-                theme.path,
-                theme.sounds
-            )
-            
-            # Check for background music
-            music_config = theme.sounds.get('backgroundMusic')
-            if music_config:
-                music_path = os.path.join(theme.path, music_config.get('file', ''))
-                if os.path.exists(music_path):
-                    self.sound_manager.play_music(
-                        music_path,
-                        loop=music_config.get('loop', True)
-                    )
-    
-    def _configure_effects(self, theme: ThemeData):
-        """Configure effects engine for theme."""
-        self.effects_engine.configure(theme.effects)
-    
-    def _configure_icons(self, theme: ThemeData):
-        """Configure icon manager for theme."""
-        if theme.is_official:
-            # Official themes use default icons
-            self.icon_manager.configure_for_official()
-        else:
-            # Custom themes can override icons
-            self.icon_manager.configure_for_custom(
-                theme.path,
-                theme.icons
-            )
-    
-    def apply_to_widget(self, widget: QWidget):
-        """
-        Apply current theme to a widget.
-        
-        Args:
-            widget: Widget to style
-        """
-        if not self.current_theme:
-            return
-        
-        stylesheet = self._generate_stylesheet(self.current_theme)
-        widget.setStyleSheet(stylesheet)
-    
-    def apply_to_application(self, app: QApplication = None):
-        """
-        Apply current theme to the entire application.
-        
-        Args:
-            app: QApplication instance (uses current if None)
-        """
-        if app is None:
-            app = QApplication.instance()
-        
-        if app and self.current_theme:
-            stylesheet = self._generate_stylesheet(self.current_theme)
-            app.setStyleSheet(stylesheet)
-    
-    def _generate_stylesheet(self, theme: ThemeData) -> str:
-        """Generate complete Qt stylesheet from theme."""
-        colors = theme.colors
-        layout = theme.layout
-        components = theme.components
-        typography = theme.typography
-        
-        # Helper to get nested values
-        def get_color(path, default='#FFFFFF'):
-            return theme.get_color(path, default)
-        
-        # Get typography
-        font_family = typography.get('fontFamily', 'Segoe UI, Arial')
-        font_size_base = typography.get('fontSize', {}).get('base', '14px')
-        
-        # Get corner radii
-        corner_sm = layout.get('cornerRadius', {}).get('small', 4)
-        corner_md = layout.get('cornerRadius', {}).get('medium', 8)
-        corner_lg = layout.get('cornerRadius', {}).get('large', 12)
-        
-        # Build stylesheet
-        stylesheet = f"""
+    return safe_callback
+
+
+# Template field, theme color path and fallback for each stylesheet color
+_COLOR_SLOTS = (
+    ('bg_primary', 'background.primary', '#1C1C1E'),
+    ('bg_secondary', 'background.secondary', '#2C2C2E'),
+    ('bg_tertiary', 'background.tertiary', 'rgba(255,255,255,0.05)'),
+    ('bg_group', 'background.tertiary', 'rgba(255,255,255,0.03)'),
+    ('text_primary', 'text.primary', '#FFFFFF'),
+    ('text_secondary', 'text.secondary', '#8E8E93'),
+    ('text_muted', 'text.muted', 'rgba(255,255,255,0.5)'),
+    ('accent_primary', 'accent.primary', '#0A84FF'),
+    ('accent_secondary', 'accent.secondary', '#0066CC'),
+    ('border_default', 'borders.default', '#3A3A3C'),
+    ('border_focus', 'borders.focus', '#0A84FF'),
+    ('border_subtle', 'borders.subtle', 'rgba(255,255,255,0.1)'),
+)
+
+# Application stylesheet skeleton, filled by ThemeEngine._build_stylesheet
+_QSS_TEMPLATE = """
             /* === Global Styles === */
             QWidget {{
-                background-color: {get_color('background.primary', '#1C1C1E')};
-                color: {get_color('text.primary', '#FFFFFF')};
+                background-color: {bg_primary};
+                color: {text_primary};
                 font-family: {font_family};
                 font-size: {font_size_base};
             }}
             
             /* === Labels === */
             QLabel {{
-                color: {get_color('text.primary', '#FFFFFF')};
+                color: {text_primary};
                 background-color: transparent;
                 padding: 4px;
             }}
             
             /* === Buttons === */
             QPushButton {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
-                padding: {components.get('button', {}).get('padding', '10px 20px')};
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
+                padding: {button_padding};
                 font-weight: 600;
                 min-height: 36px;
             }}
             
             QPushButton:hover {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
-                border-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
+                border-color: {accent_primary};
             }}
             
             QPushButton:pressed {{
-                background-color: {get_color('accent.secondary', '#0066CC')};
+                background-color: {accent_secondary};
             }}
             
             QPushButton:disabled {{
-                background-color: {get_color('background.tertiary', 'rgba(255,255,255,0.05)')};
-                color: {get_color('text.muted', 'rgba(255,255,255,0.5)')};
+                background-color: {bg_tertiary};
+                color: {text_muted};
             }}
             
             /* === Input Fields === */
             QLineEdit {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_sm}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 2px solid {border_default};
+                border-radius: {corner_sm_px};
                 padding: 8px 12px;
-                selection-background-color: {get_color('accent.primary', '#0A84FF')};
+                selection-background-color: {accent_primary};
                 min-height: 36px;
             }}
             
             QLineEdit:focus {{
-                border-color: {get_color('borders.focus', '#0A84FF')};
+                border-color: {border_focus};
             }}
             
             /* === ComboBox === */
             QComboBox {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_sm}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 2px solid {border_default};
+                border-radius: {corner_sm_px};
                 padding: 8px 12px;
                 min-height: 36px;
             }}
             
             QComboBox:hover {{
-                border-color: {get_color('accent.primary', '#0A84FF')};
+                border-color: {accent_primary};
             }}
             
             QComboBox::drop-down {{
@@ -446,92 +215,92 @@ class ThemeEngine:
             }}
             
             QComboBox QAbstractItemView {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                selection-background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border_default};
+                selection-background-color: {accent_primary};
             }}
             
             /* === Menu Bar === */
             QMenuBar {{
-                background-color: {get_color('background.primary', '#1C1C1E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border-bottom: 1px solid {get_color('borders.default', '#3A3A3C')};
+                background-color: {bg_primary};
+                color: {text_primary};
+                border-bottom: 1px solid {border_default};
                 padding: 4px;
             }}
             
             QMenuBar::item {{
                 padding: 6px 12px;
-                border-radius: {corner_sm}px;
+                border-radius: {corner_sm_px};
                 background-color: transparent;
             }}
             
             QMenuBar::item:selected {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
             }}
             
             /* === Menus === */
             QMenu {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
                 padding: 8px;
             }}
             
             QMenu::item {{
                 padding: 8px 24px;
-                border-radius: {corner_sm}px;
+                border-radius: {corner_sm_px};
             }}
             
             QMenu::item:selected {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
             }}
             
             /* === Table Widget === */
             QTableWidget {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                gridline-color: {get_color('borders.subtle', 'rgba(255,255,255,0.1)')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
-                selection-background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {bg_secondary};
+                color: {text_primary};
+                gridline-color: {border_subtle};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
+                selection-background-color: {accent_primary};
             }}
             
             QTableWidget::item {{
                 padding: 8px;
-                border-bottom: 1px solid {get_color('borders.subtle', 'rgba(255,255,255,0.1)')};
+                border-bottom: 1px solid {border_subtle};
             }}
             
             QTableWidget::item:hover {{
-                background-color: {get_color('background.tertiary', 'rgba(255,255,255,0.05)')};
+                background-color: {bg_tertiary};
             }}
             
             QHeaderView::section {{
-                background-color: {get_color('background.primary', '#1C1C1E')};
-                color: {get_color('text.primary', '#FFFFFF')};
+                background-color: {bg_primary};
+                color: {text_primary};
                 padding: 10px;
                 border: none;
-                border-bottom: 2px solid {get_color('accent.primary', '#0A84FF')};
+                border-bottom: 2px solid {accent_primary};
                 font-weight: bold;
             }}
             
             /* === Scroll Bars === */
             QScrollBar:vertical {{
-                background-color: {get_color('background.primary', '#1C1C1E')};
+                background-color: {bg_primary};
                 width: 12px;
                 margin: 0px;
             }}
             
             QScrollBar::handle:vertical {{
-                background-color: {get_color('borders.default', '#3A3A3C')};
+                background-color: {border_default};
                 border-radius: 6px;
                 min-height: 30px;
                 margin: 2px;
             }}
             
             QScrollBar::handle:vertical:hover {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
             }}
             
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -540,65 +309,65 @@ class ThemeEngine:
             
             /* === List Widget === */
             QListWidget {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
                 padding: 4px;
             }}
             
             QListWidget::item {{
                 padding: 10px;
-                border-radius: {corner_sm}px;
+                border-radius: {corner_sm_px};
                 margin: 2px;
             }}
             
             QListWidget::item:hover {{
-                background-color: {get_color('background.tertiary', 'rgba(255,255,255,0.05)')};
+                background-color: {bg_tertiary};
             }}
             
             QListWidget::item:selected {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
             }}
             
             /* === Dialog === */
             QDialog {{
-                background-color: {get_color('background.primary', '#1C1C1E')};
+                background-color: {bg_primary};
             }}
             
             /* === Text Edit === */
             QTextEdit {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 2px solid {border_default};
+                border-radius: {corner_md_px};
                 padding: 10px;
-                selection-background-color: {get_color('accent.primary', '#0A84FF')};
+                selection-background-color: {accent_primary};
             }}
             
             QTextEdit:focus {{
-                border-color: {get_color('borders.focus', '#0A84FF')};
+                border-color: {border_focus};
             }}
             
             /* === SpinBox === */
             QSpinBox, QDoubleSpinBox {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_sm}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 2px solid {border_default};
+                border-radius: {corner_sm_px};
                 padding: 8px 12px;
                 min-height: 36px;
             }}
             
             QSpinBox:focus, QDoubleSpinBox:focus {{
-                border-color: {get_color('borders.focus', '#0A84FF')};
+                border-color: {border_focus};
             }}
             
             /* === Group Box === */
             QGroupBox {{
-                background-color: {get_color('background.tertiary', 'rgba(255,255,255,0.03)')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
+                background-color: {bg_group};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
                 margin-top: 16px;
                 padding-top: 16px;
             }}
@@ -607,69 +376,69 @@ class ThemeEngine:
                 subcontrol-origin: margin;
                 subcontrol-position: top left;
                 padding: 4px 12px;
-                background-color: {get_color('accent.primary', '#0A84FF')};
-                border-radius: {corner_sm}px;
+                background-color: {accent_primary};
+                border-radius: {corner_sm_px};
                 color: white;
                 font-weight: bold;
             }}
             
             /* === Tab Widget === */
             QTabWidget::pane {{
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_md}px;
-                background-color: {get_color('background.primary', '#1C1C1E')};
+                border: 1px solid {border_default};
+                border-radius: {corner_md_px};
+                background-color: {bg_primary};
             }}
             
             QTabBar::tab {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.secondary', '#8E8E93')};
+                background-color: {bg_secondary};
+                color: {text_secondary};
                 padding: 10px 20px;
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
+                border: 1px solid {border_default};
                 border-bottom: none;
-                border-top-left-radius: {corner_md}px;
-                border-top-right-radius: {corner_md}px;
+                border-top-left-radius: {corner_md_px};
+                border-top-right-radius: {corner_md_px};
             }}
             
             QTabBar::tab:selected {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
                 color: white;
             }}
             
             QTabBar::tab:hover:!selected {{
-                background-color: {get_color('background.tertiary', 'rgba(255,255,255,0.05)')};
+                background-color: {bg_tertiary};
             }}
             
             /* === ToolTip === */
             QToolTip {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                color: {get_color('text.primary', '#FFFFFF')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_sm}px;
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border_default};
+                border-radius: {corner_sm_px};
                 padding: 6px 10px;
             }}
             
             /* === Check Box === */
             QCheckBox {{
-                color: {get_color('text.primary', '#FFFFFF')};
+                color: {text_primary};
                 spacing: 8px;
             }}
             
             QCheckBox::indicator {{
                 width: 20px;
                 height: 20px;
-                border-radius: {corner_sm}px;
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                background-color: {get_color('background.secondary', '#2C2C2E')};
+                border-radius: {corner_sm_px};
+                border: 2px solid {border_default};
+                background-color: {bg_secondary};
             }}
             
             QCheckBox::indicator:checked {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
-                border-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
+                border-color: {accent_primary};
             }}
             
             /* === Radio Button === */
             QRadioButton {{
-                color: {get_color('text.primary', '#FFFFFF')};
+                color: {text_primary};
                 spacing: 8px;
             }}
             
@@ -677,38 +446,38 @@ class ThemeEngine:
                 width: 20px;
                 height: 20px;
                 border-radius: 10px;
-                border: 2px solid {get_color('borders.default', '#3A3A3C')};
-                background-color: {get_color('background.secondary', '#2C2C2E')};
+                border: 2px solid {border_default};
+                background-color: {bg_secondary};
             }}
             
             QRadioButton::indicator:checked {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
-                border-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
+                border-color: {accent_primary};
             }}
             
             /* === Progress Bar === */
             QProgressBar {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
-                border: 1px solid {get_color('borders.default', '#3A3A3C')};
-                border-radius: {corner_sm}px;
+                background-color: {bg_secondary};
+                border: 1px solid {border_default};
+                border-radius: {corner_sm_px};
                 text-align: center;
-                color: {get_color('text.primary', '#FFFFFF')};
+                color: {text_primary};
             }}
             
             QProgressBar::chunk {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
-                border-radius: {corner_sm - 1}px;
+                background-color: {accent_primary};
+                border-radius: {corner_sm_inner_px};
             }}
             
             /* === Slider === */
             QSlider::groove:horizontal {{
-                background-color: {get_color('background.secondary', '#2C2C2E')};
+                background-color: {bg_secondary};
                 height: 8px;
                 border-radius: 4px;
             }}
             
             QSlider::handle:horizontal {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
                 width: 20px;
                 height: 20px;
                 margin: -6px 0;
@@ -716,19 +485,514 @@ class ThemeEngine:
             }}
             
             QSlider::sub-page:horizontal {{
-                background-color: {get_color('accent.primary', '#0A84FF')};
+                background-color: {accent_primary};
                 border-radius: 4px;
             }}
         """
-        
-        return stylesheet
+
+
+class ThemeData:
+    """Represents a loaded theme with all its configuration."""
     
-    def get_icon(self, name: str, size: int = 24) -> QIcon:
-        """
-        Get an icon, respecting custom theme overrides.
+    def __init__(self, name: str, config: Dict[str, Any], path: str = None, is_official: bool = True):
+        self.name = name
+        self.config = config
+        self.path = path  # Base path for custom theme assets
+        self.is_official = is_official
         
-        Args:
-            name: Icon name
+        # Extract major sections
+        self.colors = config.get('colors', {})
+        self.effects = config.get('effects', {})
+        self.typography = config.get('typography', {})
+        self.animations = config.get('animations', {})
+        self.sounds = config.get('sounds', {})
+        self.layout = config.get('layout', {})
+        self.components = config.get('components', {})
+        self.assets = config.get('assets', {})
+        self.icons = config.get('icons', {})  # Custom icon mappings
+        
+        # Background music is resolved once; only custom themes have it
+        self.music_path: Optional[str] = None
+        self.music_loop = True
+        music_config = self.sounds.get('backgroundMusic') if path and not is_official else None
+        if music_config:
+            self.music_path = os.path.join(path, music_config.get('file', ''))
+            self.music_loop = music_config.get('loop', True)
+        
+        # Dotted path -> color for every string leaf of the colors section
+        self._flat_colors: Dict[str, str] = {}
+        self._flatten_colors(self.colors, '')
+        
+        # Generated Qt stylesheet; themes are not modified after loading
+        self._stylesheet_cache: Optional[str] = None
+    
+    def _flatten_colors(self, colors: Dict[str, Any], prefix: str):
+        """Record each string leaf of a nested colors dict under its dotted path."""
+        if not isinstance(colors, dict):
+            return
+        for key, value in colors.items():
+            path = prefix + key
+            if isinstance(value, str):
+                self._flat_colors[path] = value
+            elif isinstance(value, dict):
+                self._flatten_colors(value, path + '.')
+    
+    def get_color(self, path: str, default: str = '#FFFFFF') -> str:
+        """
+        Get a color by path (e.g., 'background.primary', 'accent.glow').
+        
+        Args:
+            path: Dot-separated path to color
+            default: Default value if not found
+        """
+        return self._flat_colors.get(path, default)
+    
+    def get_component_config(self, component_type: str) -> Dict[str, Any]:
+        """Get configuration for a specific component type."""
+        return self.components.get(component_type, {})
+    
+    def get_animation_config(self, component_type: str) -> Dict[str, Any]:
+        """Get animation config for a component type."""
+        return self.animations.get('components', {}).get(component_type, {})
+
+
+def _theme_icon_source(path: str) -> QPixmap:
+    """Unscaled custom icon, shared app-wide; null if the file is unreadable."""
+    key = f"theme_icon:{path}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _theme_icon_pixmap(path: str, width: int, height: int) -> QPixmap:
+    """Custom icon scaled to fit width x height, shared app-wide."""
+    key = f"theme_icon:{path}:{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _theme_icon_source(path)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(width, height, _KEEP_ASPECT, _SMOOTH)
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _ThemeIconEngine(QIconEngine):
+    """
+    Icon engine for a custom theme icon file. Each requested size is scaled
+    from the source on demand and kept in QPixmapCache, so one icon serves
+    every size without holding a pixmap per size itself.
+    """
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+    
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        pixmap = _theme_icon_pixmap(self._path, size.width(), size.height())
+        if mode == QIcon.Mode.Normal or pixmap.isNull():
+            return pixmap
+        
+        # Disabled/active/selected variants come from the style, as for QIcon(pixmap)
+        key = f"theme_icon:{self._path}:{size.width()}x{size.height()}:{mode.value}"
+        generated = QPixmapCache.find(key)
+        if generated is None:
+            app = QApplication.instance()
+            if app is None:
+                return pixmap
+            generated = app.style().generatedIconPixmap(mode, pixmap, QStyleOption())
+            QPixmapCache.insert(key, generated)
+        return generated
+    
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        source = _theme_icon_source(self._path)
+        if source.isNull():
+            return QSize()
+        return source.size().scaled(size, _KEEP_ASPECT)
+    
+    def paint(self, painter, rect: QRect, mode: QIcon.Mode, state: QIcon.State):
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device is not None else 1.0
+        pixmap = self.pixmap(
+            QSize(round(rect.width() * ratio), round(rect.height() * ratio)), mode, state
+        )
+        if pixmap.isNull():
+            return
+        # Center the fitted pixmap in logical coordinates
+        target = QRect(0, 0, round(pixmap.width() / ratio), round(pixmap.height() / ratio))
+        target.moveCenter(rect.center())
+        painter.drawPixmap(target, pixmap)
+    
+    def clone(self) -> QIconEngine:
+        return _ThemeIconEngine(self._path)
+
+
+class ThemeIconManager:
+    """
+    Manages icon loading with custom theme icon override support.
+    Wraps IconManager and provides custom icon substitution for custom themes.
+    """
+    
+    def __init__(self, base_icon_manager: IconManager):
+        self._base_manager = base_icon_manager
+        self._custom_icons: Dict[str, str] = {}  # name -> existing custom file path
+        self._custom_theme_path: Optional[str] = None
+        # name -> engine-backed icon serving every size; None marks "no usable override"
+        self._icon_cache: Dict[str, Optional[QIcon]] = {}
+    
+    def _set_custom_icons(self, custom_icons: Dict[str, str]):
+        """
+        Install new overrides, invalidating only icons whose override changed.
+        The base manager never caches overrides, so its icons stay valid.
+        """
+        old_icons = self._custom_icons
+        changed = {
+            name for name in old_icons.keys() | custom_icons.keys()
+            if old_icons.get(name) != custom_icons.get(name)
+        }
+        self._custom_icons = custom_icons
+        for name in changed:
+            self._icon_cache.pop(name, None)
+    
+    def configure_for_official(self):
+        """Use only base icons (for official themes)."""
+        self._custom_theme_path = None
+        self._set_custom_icons({})
+    
+    def configure_for_custom(self, theme_path: str, icon_config: Dict[str, str]):
+        """
+        Configure custom icon mappings.
+        
+        Args:
+            theme_path: Base path to custom theme
+            icon_config: Mapping of icon names to relative paths
+        """
+        self._custom_theme_path = theme_path
+        # Resolve the overrides once; only files that exist are kept
+        custom_icons = {}
+        for name, relative_path in (icon_config or {}).items():
+            full_path = os.path.join(theme_path, relative_path)
+            if os.path.isfile(full_path):
+                custom_icons[name] = full_path
+        self._set_custom_icons(custom_icons)
+    
+    def _get_custom_icon(self, name: str) -> Optional[QIcon]:
+        """Custom icon for a name, or None if the theme does not override it."""
+        custom_path = self._custom_icons.get(name)
+        if custom_path is None:
+            return None
+        
+        if name not in self._icon_cache:
+            if _theme_icon_source(custom_path).isNull():
+                self._icon_cache[name] = None
+            else:
+                self._icon_cache[name] = QIcon(_ThemeIconEngine(custom_path))
+        return self._icon_cache[name]
+    
+    def get_icon(self, name: str, size: int = 24) -> QIcon:
+        """Get icon by name, checking custom icons first."""
+        # A custom icon renders any size on demand
+        icon = self._get_custom_icon(name)
+        if icon is not None:
+            return icon
+        
+        # Fall back to base icon manager
+        return self._base_manager.get_icon(name, size)
+    
+    def get_pixmap(self, name: str, size: int = 24):
+        """Get pixmap by name, checking custom icons first."""
+        if self._get_custom_icon(name) is not None:
+            return _theme_icon_pixmap(self._custom_icons[name], size, size)
+        
+        return self._base_manager.get_pixmap(name, size)
+
+
+class ThemeEngine:
+    """
+    Central theme engine orchestrating all subsystems.
+    
+    Manages:
+    - Theme loading and switching
+    - Animation engine configuration
+    - Sound manager configuration  
+    - Effects engine configuration
+    - Icon management with custom overrides
+    - Component registry updates
+    """
+    
+    _instance = None
+    
+    def __init__(self):
+        # Subsystems
+        self.animation_engine = get_animation_engine()
+        self.sound_manager = get_sound_manager()
+        self.effects_engine = get_effects_engine()
+        self.layout_engine = get_layout_engine()
+        self.component_registry = get_component_registry()
+        
+        # Icon management
+        self._base_icon_manager = IconManager.get_instance()
+        self.icon_manager = ThemeIconManager(self._base_icon_manager)
+        
+        # Current theme
+        self.current_theme: Optional[ThemeData] = None
+        # name -> (filepath, is_official, base_path); files are parsed on first use
+        self._theme_index: Dict[str, Tuple[str, bool, Optional[str]]] = {}
+        self._loaded_themes: Dict[str, ThemeData] = {}
+        
+        # Theme change callbacks: key (WeakMethod or callable) -> error-guarded wrapper
+        self._theme_change_callbacks: Dict[Any, callable] = {}
+        
+        # Load available themes
+        self._discover_themes()
+    
+    @classmethod
+    def get_instance(cls) -> 'ThemeEngine':
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = ThemeEngine()
+        return cls._instance
+    
+    def _discover_themes(self):
+        """Discover all available themes (only their names are read here)."""
+        self._theme_index.clear()
+        self._loaded_themes.clear()
+        
+        # Official themes from themes directory
+        if os.path.isdir(THEMES_DIR):
+            with os.scandir(THEMES_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        self._register_theme_file(entry.path, is_official=True)
+        
+        # Custom themes: one folder per theme holding <folder>.json
+        if os.path.isdir(CUSTOM_THEMES_DIR):
+            with os.scandir(CUSTOM_THEMES_DIR) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        json_path = os.path.join(entry.path, f"{entry.name}.json")
+                        if os.path.isfile(json_path):
+                            self._register_theme_file(json_path, is_official=False, base_path=entry.path)
+    
+    def _register_theme_file(self, filepath: str, is_official: bool, base_path: str = None):
+        """Add a theme file to the index, parsing it only if its name is not leading."""
+        name = _read_theme_name(filepath)
+        if name is None:
+            theme = self._load_theme_file(filepath, is_official=is_official, base_path=base_path)
+            if not theme:
+                return
+            name = theme.name
+            self._loaded_themes[name] = theme
+        else:
+            # A later file with the same name replaces the earlier one
+            self._loaded_themes.pop(name, None)
+        self._theme_index[name] = (filepath, is_official, base_path)
+    
+    def _materialize(self, name: str) -> Optional[ThemeData]:
+        """Get a discovered theme, loading its file on first use."""
+        theme = self._loaded_themes.get(name)
+        if theme is None:
+            entry = self._theme_index.get(name)
+            if entry is None:
+                return None
+            filepath, is_official, base_path = entry
+            theme = self._load_theme_file(filepath, is_official=is_official, base_path=base_path)
+            if theme is None:
+                # Unreadable file: stop offering it
+                del self._theme_index[name]
+                return None
+            self._loaded_themes[name] = theme
+        return theme
+    
+    def _load_theme_file(self, filepath: str, is_official: bool = True, base_path: str = None) -> Optional[ThemeData]:
+        """Load a theme from JSON file."""
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else _JSON_DECODER.decode(raw.decode('utf-8'))
+            
+            name = data.get('name', os.path.splitext(os.path.basename(filepath))[0])
+            return ThemeData(
+                name=name,
+                config=data,
+                path=base_path or os.path.dirname(filepath),
+                is_official=is_official
+            )
+        except Exception as e:
+            print(f"Error loading theme from {filepath}: {e}")
+            return None
+    
+    def get_available_themes(self) -> List[str]:
+        """Get list of available theme names."""
+        return list(self._theme_index.keys())
+    
+    def is_official_theme(self, name: str) -> bool:
+        """Check whether a discovered theme is official, without loading it."""
+        entry = self._theme_index.get(name)
+        return entry is not None and entry[1]
+    
+    def get_theme(self, name: str) -> Optional[ThemeData]:
+        """Get a theme by name."""
+        return self._materialize(name)
+    
+    def load_theme(self, theme_name: str, force: bool = False) -> bool:
+        """
+        Load and apply a theme.
+        
+        Args:
+            theme_name: Name of theme to load
+            force: Reconfigure subsystems even if the theme is already the active one
+        
+        Returns:
+            True if successful
+        """
+        theme = self._materialize(theme_name)
+        if not theme:
+            print(f"Theme '{theme_name}' not found")
+            return False
+        
+        # Re-selecting the active theme (e.g. every time a window is built)
+        # leaves the subsystems as they are; components registered since the
+        # last load and the callbacks are still updated below
+        if force or theme is not self.current_theme:
+            self.current_theme = theme
+            
+            # Configure subsystems
+            self._configure_animations(theme)
+            self._configure_sounds(theme)
+            self._configure_effects(theme)
+            self._configure_icons(theme)
+            self._configure_layout(theme)
+        
+        # Restyle components and run callbacks as one batch: each step may
+        # re-polish widgets, so painting waits until all of them are done
+        with _top_level_updates_suspended():
+            # Update all registered components
+            self.component_registry.apply_theme_to_all(theme.config)
+            
+            # Notify callbacks
+            self._notify_theme_change(theme)
+        
+        return True
+    
+    def _configure_animations(self, theme: ThemeData):
+        """Configure animation engine for theme."""
+        anim_config = theme.animations
+        
+        # Set global speed
+        global_speed = anim_config.get('globalSpeed', 1.0)
+        self.animation_engine.set_global_speed(global_speed)
+        
+        # Set component overrides
+        component_anims = anim_config.get('components', {})
+        self.animation_engine.set_custom_overrides(component_anims)
+    
+    def _configure_sounds(self, theme: ThemeData):
+        """Configure sound manager for theme."""
+        if theme.is_official:
+            # Official themes use Windows system sounds
+            self.sound_manager.configure_for_official_theme()
+        else:
+            # Custom themes can have custom sounds
+            self.sound_manager.configure_for_custom_theme(
+                theme.path,
+                theme.sounds
+            )
+            
+            # Background music; play_music checks the file exists and keeps
+            # the current source when the same file is already loaded
+            if theme.music_path:
+                self.sound_manager.play_music(theme.music_path, loop=theme.music_loop)
+    
+    def _configure_effects(self, theme: ThemeData):
+        """Configure effects engine for theme."""
+        self.effects_engine.configure(theme.effects)
+    
+    def _configure_icons(self, theme: ThemeData):
+        """Configure icon manager for theme."""
+        if theme.is_official:
+            # Official themes use default icons
+            self.icon_manager.configure_for_official()
+        else:
+            # Custom themes can override icons
+            self.icon_manager.configure_for_custom(
+                theme.path,
+                theme.icons
+            )
+    
+    def apply_to_widget(self, widget: QWidget):
+        """
+        Apply current theme to a widget.
+        
+        Args:
+            widget: Widget to style
+        """
+        if not self.current_theme:
+            return
+        
+        stylesheet = self._generate_stylesheet(self.current_theme)
+        # Re-setting an identical stylesheet still re-polishes the widget tree
+        if widget.styleSheet() != stylesheet:
+            widget.setStyleSheet(stylesheet)
+    
+    def apply_to_application(self, app: QApplication = None):
+        """
+        Apply current theme to the entire application.
+        
+        Args:
+            app: QApplication instance (uses current if None)
+        """
+        if app is None:
+            app = QApplication.instance()
+        
+        if app and self.current_theme:
+            stylesheet = self._generate_stylesheet(self.current_theme)
+            if app.styleSheet() != stylesheet:
+                app.setStyleSheet(stylesheet)
+    
+    def _generate_stylesheet(self, theme: ThemeData) -> str:
+        """Get the Qt stylesheet for a theme, building it on first use."""
+        if theme._stylesheet_cache is None:
+            theme._stylesheet_cache = self._build_stylesheet(theme)
+        return theme._stylesheet_cache
+    
+    def _build_stylesheet(self, theme: ThemeData) -> str:
+        """Generate complete Qt stylesheet from theme."""
+        layout = theme.layout
+        components = theme.components
+        typography = theme.typography
+        
+        # Resolve each color once, interned: most repeat many times in the QSS
+        get_color = theme.get_color
+        values = {
+            field: sys.intern(str(get_color(path, default)))
+            for field, path, default in _COLOR_SLOTS
+        }
+        
+        values['button_padding'] = components.get('button', {}).get('padding', '10px 20px')
+        
+        # Get typography
+        values['font_family'] = typography.get('fontFamily', 'Segoe UI, Arial')
+        values['font_size_base'] = typography.get('fontSize', {}).get('base', '14px')
+        
+        # Get corner radii, formatted as lengths once
+        corner_sm = layout.get('cornerRadius', {}).get('small', 4)
+        corner_md = layout.get('cornerRadius', {}).get('medium', 8)
+        values['corner_sm_px'] = sys.intern(f"{corner_sm}px")
+        values['corner_sm_inner_px'] = sys.intern(f"{corner_sm - 1}px")
+        values['corner_md_px'] = sys.intern(f"{corner_md}px")
+        
+        # Build stylesheet
+        return _QSS_TEMPLATE.format_map(values)
+    
+    def get_icon(self, name: str, size: int = 24) -> QIcon:
+        """
+        Get an icon, respecting custom theme overrides.
+        
+        Args:
+            name: Icon name
             size: Icon size
         
         Returns:
@@ -747,11 +1011,13 @@ class ThemeEngine:
     
     def reload_themes(self):
         """Reload all themes from disk."""
+        # Reloading creates fresh ThemeData objects, which drops every
+        # cached stylesheet along with the old ones
         current_name = self.current_theme.name if self.current_theme else None
         self._discover_themes()
         
-        if current_name and current_name in self._available_themes:
-            self.load_theme(current_name)
+        if current_name and current_name in self._theme_index:
+            self.load_theme(current_name, force=True)
     
     def _configure_layout(self, theme: ThemeData):
         """Configure layout engine for theme."""
@@ -759,26 +1025,31 @@ class ThemeEngine:
     
     def _notify_theme_change(self, theme: ThemeData):
         """Notify all callbacks about theme change."""
-        for callback in self._theme_change_callbacks:
-            try:
-                callback(theme)
-            except Exception as e:
-                print(f"Error in theme change callback: {e}")
+        # Snapshot so callbacks may (un)register others while being notified
+        dead = [
+            key for key, safe_callback in list(self._theme_change_callbacks.items())
+            if not safe_callback(theme)
+        ]
+        for key in dead:
+            self._theme_change_callbacks.pop(key, None)
     
     def register_theme_change_callback(self, callback: callable):
         """
         Register a callback to be called when theme changes.
         
+        Bound methods are held weakly, so registering one does not keep its
+        owner (typically a widget) alive; other callables are held strongly.
+        
         Args:
             callback: Callable that takes ThemeData as argument
         """
-        if callback not in self._theme_change_callbacks:
-            self._theme_change_callbacks.append(callback)
+        key = _callback_key(callback)
+        if key not in self._theme_change_callbacks:
+            self._theme_change_callbacks[key] = _safe_callback(key)
     
     def unregister_theme_change_callback(self, callback: callable):
         """Unregister a theme change callback."""
-        if callback in self._theme_change_callbacks:
-            self._theme_change_callbacks.remove(callback)
+        self._theme_change_callbacks.pop(_callback_key(callback), None)
     
     def get_all_metadata(self) -> Dict[str, Any]:
         """
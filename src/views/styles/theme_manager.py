@@ -7,6 +7,7 @@ Now uses ThemeEngine as backend for enhanced functionality.
 import os
 import sys
 import json
+from functools import lru_cache
 from typing import Dict, Optional
 
 from .theme_engine import ThemeEngine, ThemeData, get_theme_engine
@@ -26,6 +27,24 @@ THEMES_DIR = os.path.join(BASE_DIR, "media", "themes")
 LEGACY_THEMES_DIR = os.path.join(BASE_DIR, "options", "themes", "custom")
 
 
+@lru_cache(maxsize=256)
+def _luminance(color: str) -> float:
+    """Calculate luminance of a color; themes reuse a handful of colors."""
+    if color.startswith('rgba'):
+        parts = color.replace('rgba(', '').replace(')', '').split(',')
+        r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
+    elif color.startswith('#'):
+        hex_color = color.lstrip('#')
+        if len(hex_color) == 3:
+            hex_color = ''.join([c*2 for c in hex_color])
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+    else:
+        return 0.5
+    return (0.299 * r + 0.587 * g + 0.114 * b) / 255
+
+
 class Theme:
     """
     Represents a visual theme with complete customization options.
@@ -36,8 +55,24 @@ class Theme:
         self.name = name
         self.config = config
         self._theme_data: Optional[ThemeData] = None
+        # Generated stylesheet and converted legacy config; config is not
+        # modified after loading
+        self._stylesheet_cache: Optional[str] = None
+        self._resolved_config: Optional[Dict] = None
+    
+    def invalidate(self):
+        """Drop the cached stylesheet, e.g. after changing config or reloading themes."""
+        self._stylesheet_cache = None
+        self._resolved_config = None
+        self._theme_data = None
     
     def get_stylesheet(self) -> str:
+        """Get the complete CSS stylesheet for this theme, building it on first use."""
+        if self._stylesheet_cache is None:
+            self._stylesheet_cache = self._build_stylesheet()
+        return self._stylesheet_cache
+    
+    def _build_stylesheet(self) -> str:
         """Generate the complete CSS stylesheet for this theme."""
         # Use the new ThemeEngine to generate stylesheet
         engine = get_theme_engine()
@@ -49,12 +84,20 @@ class Theme:
             return engine._generate_stylesheet(theme_data)
         
         # Fallback: Create ThemeData from legacy config
-        self._theme_data = ThemeData(self.name, self._convert_legacy_config(), is_official=False)
+        self._theme_data = ThemeData(self.name, self._resolve_config(), is_official=False)
         return engine._generate_stylesheet(self._theme_data)
     
+    def _resolve_config(self) -> Dict:
+        """Legacy config converted to the nested format, with fallbacks applied once."""
+        if self._resolved_config is None:
+            self._resolved_config = self._convert_legacy_config()
+        return self._resolved_config
+    
     def _convert_legacy_config(self) -> Dict:
         """Convert legacy flat config to new nested format."""
         cfg = self.config
+        # Shared by several slots below
+        accent = cfg.get('accent', '#0A84FF')
         
         return {
             "name": self.name,
@@ -66,7 +109,7 @@ class Theme:
                     "tertiary": cfg.get('table_hover', 'rgba(255,255,255,0.05)')
                 },
                 "accent": {
-                    "primary": cfg.get('accent', '#0A84FF'),
+                    "primary": accent,
                     "secondary": cfg.get('accent_dark', '#0066CC'),
                     "glow": cfg.get('accent_glow', 'rgba(10, 132, 255, 0.4)')
                 },
@@ -74,11 +117,11 @@ class Theme:
                     "primary": cfg.get('text_primary', '#FFFFFF'),
                     "secondary": cfg.get('text_secondary', '#8E8E93'),
                     "muted": 'rgba(255, 255, 255, 0.5)',
-                    "link": cfg.get('accent', '#0A84FF')
+                    "link": accent
                 },
                 "borders": {
                     "default": cfg.get('border', '#3A3A3C'),
-                    "focus": cfg.get('accent', '#0A84FF'),
+                    "focus": accent,
                     "subtle": 'rgba(255, 255, 255, 0.1)'
                 }
             },
@@ -194,8 +237,7 @@ class ThemeManager:
         unofficial = []
         
         for name in engine.get_available_themes():
-            theme_data = engine.get_theme(name)
-            if theme_data and theme_data.is_official:
+            if engine.is_official_theme(name):
                 official.append(name)
             else:
                 unofficial.append(name)
@@ -281,24 +323,7 @@ class ThemeManager:
         else:
             bg = config.get('background', '#121212')
         
-        return cls._get_luminance(bg) < 0.5
-    
-    @classmethod
-    def _get_luminance(cls, color: str) -> float:
-        """Calculate luminance of a color."""
-        if color.startswith('rgba'):
-            parts = color.replace('rgba(', '').replace(')', '').split(',')
-            r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
-        elif color.startswith('#'):
-            hex_color = color.lstrip('#')
-            if len(hex_color) == 3:
-                hex_color = ''.join([c*2 for c in hex_color])
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-        else:
-            return 0.5
-        return (0.299 * r + 0.587 * g + 0.114 * b) / 255
+        return _luminance(bg) < 0.5
     
     @classmethod
     def get_text_color(cls) -> str:
@@ -327,6 +352,9 @@ class ThemeManager:
     @classmethod
     def reload_themes(cls):
         """Reload custom themes from disk."""
+        # Theme objects may still be held by callers; drop their stylesheets
+        for theme in THEMES.values():
+            theme.invalidate()
         THEMES.clear()
         THEMES.update(load_themes())
         
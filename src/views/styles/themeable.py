@@ -118,7 +118,10 @@ class ComponentRegistry:
     
     def __init__(self):
         self._components: Dict[str, weakref.ref] = {}
-        self._type_groups: Dict[str, List[str]] = {}  # type -> [component_ids]
+        # type -> {component_id: None}; a dict keeps registration order
+        # while giving O(1) membership checks and removal
+        self._type_groups: Dict[str, Dict[str, None]] = {}
+        self._component_types: Dict[str, str] = {}  # component_id -> type
     
     @classmethod
     def get_instance(cls) -> 'ComponentRegistry':
@@ -140,20 +143,21 @@ class ComponentRegistry:
         
         self._components[component_id] = weakref.ref(component)
         
-        # Add to type group
+        # Add to type group, leaving the previous one if the type changed
         comp_type = component.component_type
-        if comp_type not in self._type_groups:
-            self._type_groups[comp_type] = []
-        if component_id not in self._type_groups[comp_type]:
-            self._type_groups[comp_type].append(component_id)
+        previous_type = self._component_types.get(component_id)
+        if previous_type is not None and previous_type != comp_type:
+            self._type_groups[previous_type].pop(component_id, None)
+        self._component_types[component_id] = comp_type
+        self._type_groups.setdefault(comp_type, {})[component_id] = None
     
     def unregister(self, component_id: str):
         """Unregister a component."""
         if component_id in self._components:
-            # Remove from type groups
-            for type_list in self._type_groups.values():
-                if component_id in type_list:
-                    type_list.remove(component_id)
+            # Remove from its type group
+            comp_type = self._component_types.pop(component_id, None)
+            if comp_type is not None:
+                self._type_groups[comp_type].pop(component_id, None)
             
             del self._components[component_id]
     
@@ -235,6 +239,7 @@ class ComponentRegistry:
         """Clear all registered components."""
         self._components.clear()
         self._type_groups.clear()
+        self._component_types.clear()
     
     def cleanup_dead_refs(self):
         """Remove dead weak references."""
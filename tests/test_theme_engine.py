@@ -0,0 +1,54 @@
+"""
+Tests for ThemeEngine re-applying the active theme.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# The themed components pull in the sound manager, which needs QtMultimedia
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from src.views.styles.theme_engine import get_theme_engine
+from src.views.styles.theme_manager import ThemeManager
+from src.views.components.buttons.animated_button import AnimatedButton
+
+
+THEME_NAME = "Oscuro"
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_button_created_after_first_load_gets_component_config(app):
+    first_window = QWidget()
+    ThemeManager.apply_theme(first_window, THEME_NAME)
+    
+    button = AnimatedButton("Nuevo")
+    second_window = QWidget()
+    ThemeManager.apply_theme(second_window, THEME_NAME)
+    
+    engine = get_theme_engine()
+    assert engine.current_theme.name == THEME_NAME
+    assert button._theme_config == engine.current_theme.config["components"]["button"]
+
+
+def test_callback_registered_after_first_load_is_notified(app):
+    ThemeManager.apply_theme(QWidget(), THEME_NAME)
+    
+    seen = []
+    callback = seen.append
+    engine = get_theme_engine()
+    engine.register_theme_change_callback(callback)
+    try:
+        ThemeManager.apply_theme(QWidget(), THEME_NAME)
+    finally:
+        engine.unregister_theme_change_callback(callback)
+    
+    assert [theme.name for theme in seen] == [THEME_NAME]